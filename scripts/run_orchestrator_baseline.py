@@ -4,6 +4,11 @@ import json
 from dataclasses import asdict
 from pathlib import Path
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
 from altitude_warning.orchestrator import Orchestrator
 from altitude_warning.simulator import default_scenario_path, load_scenario_events
 
@@ -16,23 +21,33 @@ def main() -> None:
     events = load_scenario_events(scenario_path)
     orchestrator = Orchestrator(model_name="gpt-4o")
 
-    results = []
-    for event in events:
-        decision, assessment, policy_context, latency_ms = orchestrator.process_event(event)
-        results.append(
-            {
+    output_dir = Path("outputs")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / "baseline_results.json"
+
+    # Batch results come back in input order, so events can be zipped directly.
+    # Each record is serialized and written as it is consumed, keeping memory
+    # flat regardless of scenario length.
+    with output_path.open("w", encoding="utf-8", buffering=1 << 16) as fh:
+        fh.write("[\n")
+        first = True
+        for event, (decision, assessment, policy_context, latency_ms) in zip(
+            events, orchestrator.process_events_batch(events)
+        ):
+            record = {
                 "event": asdict(event),
                 "decision": asdict(decision),
                 "assessment": asdict(assessment),
                 "policy_context": policy_context,
                 "latency_ms": round(latency_ms, 2),
             }
-        )
-
-    output_dir = Path("outputs")
-    output_dir.mkdir(parents=True, exist_ok=True)
-    output_path = output_dir / "baseline_results.json"
-    output_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+            if orjson is not None:
+                serialized = orjson.dumps(record, option=orjson.OPT_INDENT_2).decode()
+            else:
+                serialized = json.dumps(record, indent=2)
+            fh.write(("" if first else ",\n") + serialized)
+            first = False
+        fh.write("\n]\n")
     print(output_path)
 
 
@@ -4,9 +4,13 @@ Install extras first:
     pip install -e '.[api]'
 """
 
+import asyncio
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import AsyncIterator
 
+from altitude_warning.models import EventPayload, encode_event_payload
 from altitude_warning.orchestrator import Orchestrator
 from altitude_warning.simulator import (
         default_scenario_path,
@@ -16,55 +20,81 @@ from altitude_warning.simulator import (
 
 try:
     from fastapi import FastAPI
+    from fastapi.responses import StreamingResponse
 except ModuleNotFoundError as exc:  # pragma: no cover
     raise SystemExit(
         "FastAPI not installed. Run: pip install -e '.[api]'"
     ) from exc
 
+try:
+    from fastapi.responses import ORJSONResponse as _DefaultResponse
+except (ModuleNotFoundError, ImportError):  # pragma: no cover - orjson optional
+    from fastapi.responses import JSONResponse as _DefaultResponse
 
-app = FastAPI(title="Phase A Altitude Early Warning")
+app = FastAPI(title="Phase A Altitude Early Warning", default_response_class=_DefaultResponse)
 
 
 def _enable_tracing() -> None:
     os.environ.setdefault("LANGCHAIN_TRACING_V2", "true")
 
 
+@lru_cache(maxsize=8)
+def _get_orchestrator(trace_enabled: bool, model_name: str | None) -> Orchestrator:
+    """Reuse compiled orchestrators across requests; graph compilation and
+    LLM client construction are too expensive to repeat per call."""
+    return Orchestrator(trace_enabled=trace_enabled, model_name=model_name)
+
+
 @app.get("/health")
 def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
 @app.get("/sim/inject/altitude-breach")
-def inject_altitude_breach(
+async def inject_altitude_breach(
     include_trace: bool = False,
     scenario_path: str | None = None,
     model: str | None = None,
-) -> dict[str, list[dict[str, str | float | list[dict[str, str | float]] | None]]]:
+    max_concurrency: int = 4,
+) -> StreamingResponse:
     if include_trace:
         _enable_tracing()
 
-    orchestrator = Orchestrator(trace_enabled=include_trace, model_name=model)
+    orchestrator = _get_orchestrator(include_trace, model)
     path = Path(scenario_path) if scenario_path else default_scenario_path()
     events = load_scenario_events(path) if path.exists() else generate_altitude_breach_events()
 
-    out: list[dict[str, str | float | list[dict[str, str | float]] | None]] = []
-    for event in events:
-        decision, assessment, _policy_context, latency_ms = orchestrator.process_event(event)
-        payload: dict[str, str | float | list[dict[str, str | float]] | None] = {
-            "drone_id": decision.drone_id,
-            "route": decision.route,
-            "status": decision.status,
-            "message": decision.message,
-            "risk_band": decision.risk_band,
-            "rationale": decision.rationale,
-            "risk_score": round(decision.risk_score, 3),
-            "confidence": round(decision.confidence, 3),
-            "predicted_altitude_ft": round(assessment.predicted_altitude_ft, 1),
-            "ceiling_ft": assessment.ceiling_ft,
-            "latency_ms": round(latency_ms, 2),
-        }
-        if include_trace:
-            payload["trace_id"] = decision.trace_id
-            payload["trace"] = decision.trace
-        out.append(payload)
-    return {"events": out}
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _bounded(event):
+        async with semaphore:
+            return await orchestrator.aprocess_event(event)
+
+    async def _event_chunks() -> AsyncIterator[bytes]:
+        # Events run concurrently, but chunks stream in input order, so the
+        # first byte goes out after the first event instead of the whole batch.
+        tasks = [asyncio.create_task(_bounded(event)) for event in events]
+        yield b'{"events":['
+        first = True
+        for task in tasks:
+            decision, assessment, _policy_context, latency_ms = await task
+            payload = EventPayload(
+                drone_id=decision.drone_id,
+                route=decision.route,
+                status=decision.status,
+                message=decision.message,
+                risk_band=decision.risk_band,
+                rationale=decision.rationale,
+                risk_score=round(decision.risk_score, 3),
+                confidence=round(decision.confidence, 3),
+                predicted_altitude_ft=round(assessment.predicted_altitude_ft, 1),
+                ceiling_ft=assessment.ceiling_ft,
+                latency_ms=round(latency_ms, 2),
+                trace_id=decision.trace_id if include_trace else None,
+                trace=decision.trace if include_trace else None,
+            )
+            yield (b"" if first else b",") + encode_event_payload(payload)
+            first = False
+        yield b"]}"
+
+    return StreamingResponse(_event_chunks(), media_type="application/json")
@@ -1,8 +1,9 @@
 import argparse
-import json
 import os
+import sys
 from pathlib import Path
 
+from altitude_warning.models import EventPayload, encode_event_payload
 from altitude_warning.orchestrator import Orchestrator
 from altitude_warning.simulator import (
     default_scenario_path,
@@ -33,25 +34,23 @@ def main() -> None:
     scenario_path = Path(args.scenario)
     events = load_scenario_events(scenario_path) if scenario_path.exists() else generate_altitude_breach_events()
 
-    for event in events:
-        decision, assessment, _policy_context, latency_ms = orchestrator.process_event(event)
-        payload = {
-            "drone_id": decision.drone_id,
-            "route": decision.route,
-            "status": decision.status,
-            "message": decision.message,
-            "risk_band": decision.risk_band,
-            "rationale": decision.rationale,
-            "risk_score": round(decision.risk_score, 3),
-            "confidence": round(decision.confidence, 3),
-            "predicted_altitude_ft": round(assessment.predicted_altitude_ft, 1),
-            "ceiling_ft": assessment.ceiling_ft,
-            "latency_ms": round(latency_ms, 2),
-        }
-        if args.trace:
-            payload["trace_id"] = decision.trace_id
-            payload["trace"] = decision.trace
-        print(json.dumps(payload))
+    for decision, assessment, _policy_context, latency_ms in orchestrator.process_events_batch(events):
+        payload = EventPayload(
+            drone_id=decision.drone_id,
+            route=decision.route,
+            status=decision.status,
+            message=decision.message,
+            risk_band=decision.risk_band,
+            rationale=decision.rationale,
+            risk_score=round(decision.risk_score, 3),
+            confidence=round(decision.confidence, 3),
+            predicted_altitude_ft=round(assessment.predicted_altitude_ft, 1),
+            ceiling_ft=assessment.ceiling_ft,
+            latency_ms=round(latency_ms, 2),
+            trace_id=decision.trace_id if args.trace else None,
+            trace=decision.trace if args.trace else None,
+        )
+        sys.stdout.buffer.write(encode_event_payload(payload) + b"\n")
 
 
 if __name__ == "__main__":
@@ -9,3 +9,9 @@ class Thresholds:
 
 
 THRESHOLDS = Thresholds()
+
+# Module-level bindings for hot loops: plain name loads are cheaper than
+# attribute access on the frozen dataclass instance.
+HORIZON_SECONDS = THRESHOLDS.horizon_seconds
+RISK_ALERT_THRESHOLD = THRESHOLDS.risk_alert_threshold
+CONFIDENCE_AUTO_NOTIFY = THRESHOLDS.confidence_auto_notify
@@ -39,6 +39,11 @@ PROCESSED_COLUMNS = [
     "altitude_margin_to_ceiling_ft",  # Distance to ceiling: ceiling_ft - altitude_ft.
     "weather_stress_factor",  # Normalized weather burden score (0..1).
     "predicted_altitude_ft_8s",  # Projected altitude after 8 seconds.
+    "risk_score",  # Computed risk score (0..1).
+    "confidence",  # Confidence score (0..1).
+    "route",  # Decision path: monitor, auto_notify, or hitl_review.
+    "ceiling_cross_within_8s",  # Binary label for projected crossing in 8 seconds.
+    "time_to_ceiling_cross_sec",  # Estimated crossing time in seconds when applicable.
 ]
 
 # Feature schema used for model training/evaluation and risk analytics.
@@ -3,62 +3,58 @@
 from __future__ import annotations
 
 import argparse
-import csv
-import math
-from datetime import UTC, datetime, timedelta
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
+from altitude_warning.config import CONFIDENCE_AUTO_NOTIFY, HORIZON_SECONDS, RISK_ALERT_THRESHOLD
 from altitude_warning.data.contract import (
     FEATURE_COLUMNS,
     PROCESSED_COLUMNS,
     RAW_TELEMETRY_COLUMNS,
     RAW_WEATHER_COLUMNS,
 )
-from altitude_warning.tools import ceiling_tool, policy_tool, risk_tool, trajectory_tool
-
-
-def _to_iso(ts: datetime) -> str:
-    return ts.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
-
 
-def _clamp(value: float, lo: float, hi: float) -> float:
-    # Keep computed values inside a safe numeric range.
-    # Example: clamp(1.2, 0, 1) -> 1.0
-    return max(lo, min(value, hi))
 
+def weather_stress_factor(wind_mps, gust_mps, wind_ref: float = 12.0, gust_ref: float = 18.0):
+    """Compute a normalized weather burden score in [0, 1].
 
-def weather_stress_factor(wind_mps: float, gust_mps: float, wind_ref: float = 12.0, gust_ref: float = 18.0) -> float:
-    """Compute a normalized weather burden score in [0, 1]."""
+    Accepts scalars or NumPy arrays; the clamp runs as a single `np.clip`
+    call either way.
+    """
     # Weight sustained wind more than gust spikes:
     # stress = 0.6 * normalized_wind + 0.4 * normalized_gust
     # Intuition: sustained wind creates persistent control/trajectory pressure,
     # while gusts are short spikes; both matter, but baseline wind is weighted higher.
     # Clamp the final value to [0, 1] for stable downstream logic.
-    return _clamp(0.6 * (wind_mps / wind_ref) + 0.4 * (gust_mps / gust_ref), 0.0, 1.0)
+    return np.clip(0.6 * (wind_mps / wind_ref) + 0.4 * (gust_mps / gust_ref), 0.0, 1.0)
 
 
-def _write_csv(path: Path, rows: list[dict[str, object]], fieldnames: list[str]) -> None:
-    # Open mode "w" intentionally overwrites previous generated outputs.
-    # This keeps each pipeline run deterministic and prevents stale row carryover.
+def _write_csv(path: Path, frame: pd.DataFrame, fieldnames: list[str]) -> None:
+    # Each run intentionally overwrites previous generated outputs to keep the
+    # pipeline deterministic and prevent stale row carryover. The columnar
+    # frame serializes in one pass through a 1 MiB buffer, into a temp file
+    # that is renamed over the target so concurrent writers stay atomic.
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as fh:
-        writer = csv.DictWriter(fh, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w", newline="", encoding="utf-8", buffering=1 << 20) as fh:
+        frame[fieldnames].to_csv(fh, index=False)
+    os.replace(tmp_path, path)
 
 
-def generate_raw_data(base_dir: Path, duration_seconds: int = 120) -> tuple[Path, Path]:
-    """Generate deterministic 1 Hz telemetry and weather rows for two drones."""
+def generate_raw_data(duration_seconds: int = 120) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Generate deterministic 1 Hz telemetry and weather frames for two drones."""
     # Pseudo logic:
     # 1) Define two drone profiles with different start times and locations.
     # 2) For each second in the duration, synthesize telemetry signals.
     # 3) Build quality flags (GPS fix, interpolation, delay, signal strength).
     # 4) Generate weather at the same second-level cadence.
-    # 5) Write two raw CSVs: telemetry and weather.
-    raw_dir = base_dir / "raw"
-    raw_telemetry_path = raw_dir / "telemetry.csv"
-    raw_weather_path = raw_dir / "weather.csv"
-
+    # 5) Return the in-memory telemetry and weather frames; serialization
+    #    happens once at the end of the pipeline.
     drone_configs = [
         {
             "drone_id": "D-2001",
@@ -78,207 +74,237 @@ def generate_raw_data(base_dir: Path, duration_seconds: int = 120) -> tuple[Path
         },
     ]
 
-    telemetry_rows: list[dict[str, object]] = []
-    weather_map: dict[str, dict[str, object]] = {}
+    second = np.arange(duration_seconds)
+
+    # The sinusoidal variation tables depend only on the second index, so they
+    # are computed once and shared across both drone timelines.
+    sin_18 = np.sin(second / 18.0)
+    cos_18 = np.cos(second / 18.0)
+    ground_speed_fps = np.round(14.0 + 1.8 * np.sin(second / 12.0), 3)
+    heading_wobble = 2.5 * np.sin(second / 20.0)
+    signal_wave = 10 * np.cos(second / 16.0)
+    delay_wave = np.abs(4 * np.sin(second / 15.0))
+
+    # Weather values are drone-independent; only the timestamps differ.
+    wind_mps = np.round(4.2 + 0.015 * second + 0.55 * np.sin(second / 10.0), 3)
+    gust_boost = np.where((second >= 65) & (second <= 95), 2.1, 0.9)
+    gust_mps = np.round(wind_mps + gust_boost + 0.35 * np.cos(second / 11.0), 3)
+    wind_direction_deg = np.round(228 + 12 * np.sin(second / 30.0), 3)
+    visibility_km = np.round(np.clip(9.8 - 0.01 * second + 0.15 * np.cos(second / 9.0), 6.0, 10.0), 3)
+
+    telemetry_frames: list[pd.DataFrame] = []
+    weather_frames: list[pd.DataFrame] = []
 
     # Build each drone timeline independently so datasets reflect asynchronous flights.
     for cfg in drone_configs:
-        altitude_ft = cfg["start_altitude"]
-        for second in range(duration_seconds):
-            ts = cfg["start"] + timedelta(seconds=second)
-            ts_iso = _to_iso(ts)
-
-            if cfg["drone_id"] == "D-2001":
-                # Fast-climb window to create a clear risk divergence.
-                if second < 40:
-                    vertical_speed_fps = 1.0
-                elif second < 70:
-                    vertical_speed_fps = 2.0
-                elif second < 95:
-                    vertical_speed_fps = 4.2
-                else:
-                    vertical_speed_fps = 2.2
-            else:
-                # Baseline steady climb to contrast with the fast-climb drone.
-                if second < 80:
-                    vertical_speed_fps = 0.9
-                else:
-                    vertical_speed_fps = 1.2
-
-            # Add smooth movement variation to avoid unrealistic constant-speed traces.
-            ground_speed_fps = 14.0 + 1.8 * math.sin(second / 12.0)
-            heading_deg = cfg["heading"] + 2.5 * math.sin(second / 20.0)
-
-            # Emit occasional quality degradation events so quality filters can be tested.
-            gps_fix_ok = 0 if second % 57 == 0 else 1
-            is_interpolated = 0 if gps_fix_ok == 1 else 1
-            signal_strength = int(_clamp(82 + 10 * math.cos(second / 16.0) - (10 if is_interpolated else 0), 20, 100))
-            message_delay_ms = int(35 + (90 if is_interpolated else 0) + abs(4 * math.sin(second / 15.0)))
-
-            telemetry_rows.append(
+        timestamps = pd.date_range(cfg["start"], periods=duration_seconds, freq="1s").strftime(
+            "%Y-%m-%dT%H:%M:%SZ"
+        )
+
+        if cfg["drone_id"] == "D-2001":
+            # Fast-climb window to create a clear risk divergence.
+            vertical_speed_fps = np.select(
+                [second < 40, second < 70, second < 95], [1.0, 2.0, 4.2], default=2.2
+            )
+        else:
+            # Baseline steady climb to contrast with the fast-climb drone.
+            vertical_speed_fps = np.where(second < 80, 0.9, 1.2)
+
+        # Altitude at second k reflects climb through the previous seconds.
+        altitude_ft = cfg["start_altitude"] + np.cumsum(vertical_speed_fps) - vertical_speed_fps
+
+        # Emit occasional quality degradation events so quality filters can be tested.
+        gps_fix_ok = np.where(second % 57 == 0, 0, 1)
+        is_interpolated = 1 - gps_fix_ok
+        signal_strength = np.clip(82 + signal_wave - 10 * is_interpolated, 20, 100).astype(int)
+        message_delay_ms = (35 + 90 * is_interpolated + delay_wave).astype(int)
+
+        telemetry_frames.append(
+            pd.DataFrame(
                 {
-                    "event_id": f"{cfg['drone_id']}-{second:04d}",
+                    "event_id": [f"{cfg['drone_id']}-{s:04d}" for s in range(duration_seconds)],
                     "drone_id": cfg["drone_id"],
-                    "timestamp_iso": ts_iso,
-                    "lat": round(cfg["lat"] + 0.0002 * math.sin(second / 18.0), 7),
-                    "lon": round(cfg["lon"] + 0.0002 * math.cos(second / 18.0), 7),
-                    "altitude_ft": round(altitude_ft, 2),
-                    "vertical_speed_fps": round(vertical_speed_fps, 3),
-                    "ground_speed_fps": round(ground_speed_fps, 3),
-                    "heading_deg": round(heading_deg, 3),
+                    "timestamp_iso": timestamps,
+                    "lat": np.round(cfg["lat"] + 0.0002 * sin_18, 7),
+                    "lon": np.round(cfg["lon"] + 0.0002 * cos_18, 7),
+                    "altitude_ft": np.round(altitude_ft, 2),
+                    "vertical_speed_fps": np.round(vertical_speed_fps, 3),
+                    # Smooth movement variation avoids unrealistic constant-speed traces.
+                    "ground_speed_fps": ground_speed_fps,
+                    "heading_deg": np.round(cfg["heading"] + heading_wobble, 3),
                     "gps_fix_ok": gps_fix_ok,
                     "signal_strength": signal_strength,
                     "message_delay_ms": message_delay_ms,
                     "is_interpolated": is_interpolated,
                 }
             )
+        )
 
-            # Weather context follows the same second-level cadence.
-            # A gust window is injected to create visible risk amplification segments.
-            wind_base = 4.2 + 0.015 * second
-            gust_boost = 2.1 if 65 <= second <= 95 else 0.9
-            wind_mps = round(wind_base + 0.55 * math.sin(second / 10.0), 3)
-            gust_mps = round(wind_mps + gust_boost + 0.35 * math.cos(second / 11.0), 3)
-
-            weather_map[ts_iso] = {
-                "timestamp_iso": ts_iso,
-                "wind_mps": wind_mps,
-                "gust_mps": gust_mps,
-                "wind_direction_deg": round(228 + 12 * math.sin(second / 30.0), 3),
-                "visibility_km": round(_clamp(9.8 - 0.01 * second + 0.15 * math.cos(second / 9.0), 6.0, 10.0), 3),
-            }
-
-            altitude_ft += vertical_speed_fps
-
-    # Sort weather by timestamp so downstream joins are deterministic and reproducible.
-    weather_rows = [weather_map[k] for k in sorted(weather_map.keys())]
-    _write_csv(raw_telemetry_path, telemetry_rows, RAW_TELEMETRY_COLUMNS)
-    _write_csv(raw_weather_path, weather_rows, RAW_WEATHER_COLUMNS)
-    return raw_telemetry_path, raw_weather_path
-
-
-def build_processed_data(base_dir: Path, raw_telemetry_path: Path, raw_weather_path: Path) -> Path:
-    """Join raw telemetry/weather and compute derived operational fields."""
-    processed_dir = base_dir / "processed"
-    processed_path = processed_dir / "telemetry_processed.csv"
-
-    weather_lookup: dict[str, dict[str, str]] = {}
-    # Build O(1) weather lookup by timestamp for stable second-level joins.
-    with raw_weather_path.open("r", newline="", encoding="utf-8") as fh:
-        for row in csv.DictReader(fh):
-            weather_lookup[row["timestamp_iso"]] = row
-
-    processed_rows: list[dict[str, object]] = []
-    # Enrich each telemetry record with weather and operational risk context.
-    with raw_telemetry_path.open("r", newline="", encoding="utf-8") as fh:
-        for row in csv.DictReader(fh):
-            ts = row["timestamp_iso"]
-            weather = weather_lookup[ts]
-
-            lat = float(row["lat"])
-            lon = float(row["lon"])
-            altitude_ft = float(row["altitude_ft"])
-            vertical_speed_fps = float(row["vertical_speed_fps"])
-            wind_mps = float(weather["wind_mps"])
-            gust_mps = float(weather["gust_mps"])
-
-            # Derived fields are designed for both operations monitoring and model features.
-            ceiling_ft = ceiling_tool(lat, lon)
-            margin_ft = ceiling_ft - altitude_ft
-            predicted_altitude_ft_8s = trajectory_tool(altitude_ft, vertical_speed_fps, horizon_seconds=8)
-            weather_stress = weather_stress_factor(wind_mps, gust_mps)
-
-            processed_rows.append(
+        # Weather context follows the same second-level cadence.
+        # A gust window is injected to create visible risk amplification segments.
+        weather_frames.append(
+            pd.DataFrame(
                 {
-                    **row,
+                    "timestamp_iso": timestamps,
                     "wind_mps": wind_mps,
                     "gust_mps": gust_mps,
-                    "wind_direction_deg": float(weather["wind_direction_deg"]),
-                    "visibility_km": float(weather["visibility_km"]),
-                    "ceiling_ft": round(ceiling_ft, 3),
-                    "altitude_margin_to_ceiling_ft": round(margin_ft, 3),
-                    "weather_stress_factor": round(weather_stress, 4),
-                    "predicted_altitude_ft_8s": round(predicted_altitude_ft_8s, 3),
+                    "wind_direction_deg": wind_direction_deg,
+                    "visibility_km": visibility_km,
                 }
             )
-
-    _write_csv(processed_path, processed_rows, PROCESSED_COLUMNS)
-    return processed_path
-
-
-def build_feature_data(base_dir: Path, processed_path: Path) -> Path:
+        )
+
+    telemetry_df = pd.concat(telemetry_frames, ignore_index=True)
+    # Later drones win on overlapping timestamps, matching the old map insert
+    # order. Each drone emits a contiguous ascending window and configs are
+    # ordered by start time, so after keep-last dedup the concatenated rows
+    # are already sorted — no O(N log N) timestamp sort needed.
+    weather_df = pd.concat(weather_frames, ignore_index=True).drop_duplicates(
+        subset="timestamp_iso", keep="last", ignore_index=True
+    )
+
+    return telemetry_df, weather_df
+
+
+def load_raw_data(base_dir: Path) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Load previously generated raw telemetry and weather frames from disk.
+
+    The two reads are independent and I/O-bound, so they run on worker
+    threads and overlap instead of executing serially.
+    """
+    telemetry_path = base_dir / "raw" / "telemetry.csv"
+    weather_path = base_dir / "raw" / "weather.csv"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        telemetry_future = executor.submit(pd.read_csv, telemetry_path)
+        weather_future = executor.submit(pd.read_csv, weather_path)
+        return telemetry_future.result(), weather_future.result()
+
+
+def _ceiling_ft_array(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """Vectorized counterpart of `tools.ceiling_tool` for columnar pipelines."""
+    return np.where((lat > 37.6) & (lon < -122.2), 300.0, 400.0)
+
+
+def _risk_arrays(
+    predicted_altitude_ft: np.ndarray,
+    ceiling_ft: np.ndarray,
+    vertical_speed_fps: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized counterpart of `tools.risk_tool` returning (risk, confidence)."""
+    safe_ceiling = np.where(ceiling_ft > 0, ceiling_ft, 1.0)
+    margin_ratio = (predicted_altitude_ft - ceiling_ft) / safe_ceiling
+    climb_factor = np.maximum(vertical_speed_fps, 0.0) / 10.0
+
+    breach_score = np.clip(0.82 + np.minimum(0.15, margin_ratio * 2.0) + 0.05 * climb_factor, 0.0, 1.0)
+    margin_score = np.clip(0.55 + margin_ratio + 0.2 * climb_factor, 0.0, 1.0)
+
+    risk_score = np.where(
+        ceiling_ft <= 0,
+        1.0,
+        np.where(predicted_altitude_ft > ceiling_ft, breach_score, margin_score),
+    )
+    confidence = np.where(ceiling_ft <= 0, 0.3, np.clip(0.6 + 0.25 * climb_factor, 0.0, 1.0))
+    return risk_score, confidence
+
+
+def build_processed_data(telemetry_df: pd.DataFrame, weather_df: pd.DataFrame) -> pd.DataFrame:
+    """Join raw telemetry/weather and compute derived operational fields."""
+    # Second-level timestamp join replaces the per-row dict lookup.
+    df = telemetry_df.merge(weather_df, on="timestamp_iso", how="left", validate="many_to_one")
+
+    # Derived fields are designed for both operations monitoring and model features.
+    ceiling_ft = _ceiling_ft_array(df["lat"].to_numpy(), df["lon"].to_numpy())
+    altitude_ft = df["altitude_ft"].to_numpy()
+    vertical_speed_fps = df["vertical_speed_fps"].to_numpy()
+    weather_stress = np.round(
+        weather_stress_factor(df["wind_mps"].to_numpy(), df["gust_mps"].to_numpy()), 4
+    )
+    predicted_altitude_ft_8s = np.round(altitude_ft + vertical_speed_fps * HORIZON_SECONDS, 3)
+
+    df["ceiling_ft"] = np.round(ceiling_ft, 3)
+    df["altitude_margin_to_ceiling_ft"] = np.round(ceiling_ft - altitude_ft, 3)
+    df["weather_stress_factor"] = weather_stress
+    df["predicted_altitude_ft_8s"] = predicted_altitude_ft_8s
+
+    # Risk and routing derivations live here too, so the feature build is a
+    # pure projection instead of re-deriving them from already-computed columns.
+    # Weather-adjusted climb rate makes windy intervals more risk-sensitive.
+    adjusted_vertical_speed = vertical_speed_fps + (2.0 * weather_stress)
+    risk_score, confidence = _risk_arrays(predicted_altitude_ft_8s, ceiling_ft, adjusted_vertical_speed)
+    df["risk_score"] = np.round(risk_score, 4)
+    df["confidence"] = np.round(confidence, 4)
+    df["route"] = np.where(
+        risk_score >= RISK_ALERT_THRESHOLD,
+        np.where(confidence >= CONFIDENCE_AUTO_NOTIFY, "auto_notify", "hitl_review"),
+        "monitor",
+    )
+
+    # Binary target for classification-style evaluation.
+    df["ceiling_cross_within_8s"] = (predicted_altitude_ft_8s > ceiling_ft).astype(int)
+
+    # Time-to-cross target for lead-time analysis and ranking; blank where the
+    # drone is not climbing toward the ceiling or crosses outside the horizon.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ttc = (ceiling_ft - altitude_ft) / adjusted_vertical_speed
+    ttc_valid = (adjusted_vertical_speed > 0) & (altitude_ft < ceiling_ft) & (ttc >= 0) & (ttc <= 8)
+    df["time_to_ceiling_cross_sec"] = pd.Series(np.round(ttc, 3)).where(ttc_valid, "")
+
+    return df
+
+
+def build_feature_data(processed_df: pd.DataFrame) -> pd.DataFrame:
     """Create model-ready feature dataset from processed operational rows."""
-    processed_dir = base_dir / "processed"
-    features_path = processed_dir / "ceiling_risk_features.csv"
-
-    feature_rows: list[dict[str, object]] = []
-    # Convert enriched operations rows into model-ready features and training labels.
-    with processed_path.open("r", newline="", encoding="utf-8") as fh:
-        for row in csv.DictReader(fh):
-            altitude_ft = float(row["altitude_ft"])
-            vertical_speed_fps = float(row["vertical_speed_fps"])
-            ceiling_ft = float(row["ceiling_ft"])
-            predicted_altitude_ft_8s = float(row["predicted_altitude_ft_8s"])
-            weather_stress = float(row["weather_stress_factor"])
-
-            # Weather-adjusted climb rate makes windy intervals more risk-sensitive.
-            adjusted_vertical_speed = vertical_speed_fps + (2.0 * weather_stress)
-            risk_score, confidence = risk_tool(predicted_altitude_ft_8s, ceiling_ft, adjusted_vertical_speed)
-            route, _ = policy_tool(risk_score, confidence)
-
-            # Binary target for classification-style evaluation.
-            cross_within_8s = 1 if predicted_altitude_ft_8s > ceiling_ft else 0
-
-            if adjusted_vertical_speed <= 0 or altitude_ft >= ceiling_ft:
-                time_to_ceiling_cross_sec = ""
-            else:
-                # Time-to-cross target for lead-time analysis and ranking.
-                ttc = (ceiling_ft - altitude_ft) / adjusted_vertical_speed
-                time_to_ceiling_cross_sec = round(ttc, 3) if 0 <= ttc <= 8 else ""
-
-            feature_rows.append(
-                {
-                    "drone_id": row["drone_id"],
-                    "timestamp_iso": row["timestamp_iso"],
-                    "altitude_ft": round(altitude_ft, 3),
-                    "vertical_speed_fps": round(vertical_speed_fps, 3),
-                    "ceiling_ft": round(ceiling_ft, 3),
-                    "altitude_margin_to_ceiling_ft": round(float(row["altitude_margin_to_ceiling_ft"]), 3),
-                    "weather_stress_factor": round(weather_stress, 4),
-                    "predicted_altitude_ft_8s": round(predicted_altitude_ft_8s, 3),
-                    "risk_score": round(risk_score, 4),
-                    "confidence": round(confidence, 4),
-                    "risk_band": "",
-                    "route": route,
-                    "rationale": "",
-                    "ceiling_cross_within_8s": cross_within_8s,
-                    "time_to_ceiling_cross_sec": time_to_ceiling_cross_sec,
-                }
-            )
-
-    _write_csv(features_path, feature_rows, FEATURE_COLUMNS)
-    return features_path
-
-
-def run_data_pipeline(base_dir: Path, duration_seconds: int = 120) -> dict[str, Path]:
-    raw_telemetry, raw_weather = generate_raw_data(base_dir=base_dir, duration_seconds=duration_seconds)
-    processed = build_processed_data(base_dir=base_dir, raw_telemetry_path=raw_telemetry, raw_weather_path=raw_weather)
-    features = build_feature_data(base_dir=base_dir, processed_path=processed)
-    return {
-        "raw_telemetry": raw_telemetry,
-        "raw_weather": raw_weather,
-        "processed": processed,
-        "features": features,
+    # Every derived column already exists on the processed frame; only the
+    # agent-filled placeholders are added before projecting the feature schema.
+    features = processed_df.copy()
+    features["risk_band"] = ""
+    features["rationale"] = ""
+    return features[FEATURE_COLUMNS]
+
+
+def run_data_pipeline(base_dir: Path, duration_seconds: int = 120, reuse_raw: bool = False) -> dict[str, Path]:
+    """Run the pipeline fully in memory and write all CSVs in one final step."""
+    if reuse_raw:
+        telemetry_df, weather_df = load_raw_data(base_dir)
+    else:
+        telemetry_df, weather_df = generate_raw_data(duration_seconds=duration_seconds)
+    processed_df = build_processed_data(telemetry_df, weather_df)
+    features_df = build_feature_data(processed_df)
+
+    outputs = {
+        "raw_telemetry": (base_dir / "raw" / "telemetry.csv", telemetry_df, RAW_TELEMETRY_COLUMNS),
+        "raw_weather": (base_dir / "raw" / "weather.csv", weather_df, RAW_WEATHER_COLUMNS),
+        "processed": (base_dir / "processed" / "telemetry_processed.csv", processed_df, PROCESSED_COLUMNS),
+        "features": (base_dir / "processed" / "ceiling_risk_features.csv", features_df, FEATURE_COLUMNS),
     }
+    # The four writes are I/O-bound and independent, so overlap them; the
+    # wall-clock cost drops to the slowest file.
+    with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+        futures = [
+            executor.submit(_write_csv, path, frame, fieldnames)
+            for path, frame, fieldnames in outputs.values()
+        ]
+        for future in futures:
+            future.result()
+    return {name: path for name, (path, _frame, _fieldnames) in outputs.items()}
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Build raw/processed/feature datasets.")
     parser.add_argument("--base-dir", default="data", help="Output base data directory")
     parser.add_argument("--duration-seconds", type=int, default=120, help="Per-drone generation duration in seconds")
+    parser.add_argument(
+        "--reuse-raw",
+        action="store_true",
+        help="Rebuild processed/feature datasets from the existing raw CSVs instead of regenerating them.",
+    )
     args = parser.parse_args()
 
-    outputs = run_data_pipeline(base_dir=Path(args.base_dir), duration_seconds=args.duration_seconds)
+    outputs = run_data_pipeline(
+        base_dir=Path(args.base_dir),
+        duration_seconds=args.duration_seconds,
+        reuse_raw=args.reuse_raw,
+    )
     for name, path in outputs.items():
         print(f"{name}: {path}")
 
@@ -10,18 +10,39 @@ Interactive telemetry enhancements:
    for the *selected* event, before running the main orchestrator analysis.
 
 Notes:
-- Streamlit isn't a true real-time animation engine; the "Play" button uses a short,
-  frame-by-frame loop (9 frames) that updates a placeholder chart.
+- Playback is a client-side Plotly frame animation (9 frames); the chart's
+  Play button animates the marker in the browser without server reruns.
 """
 
+import asyncio
+import functools
 import json
 import os
+import time
+from collections import Counter
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
+import numpy as np
+import pandas as pd
 import streamlit as st
 import plotly.graph_objects as go
+import plotly.io as pio
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+else:
+    # Serialize figures (numpy-backed traces included) with orjson; every
+    # st.plotly_chart call pays this encoding cost.
+    pio.json.config.default_engine = "orjson"
+
+try:
+    import ijson
+except ModuleNotFoundError:  # pragma: no cover - full-parse fallback
+    ijson = None
 
 import warnings
 warnings.filterwarnings(
@@ -33,18 +54,54 @@ warnings.filterwarnings(
 # CSS loader (simple)
 # ----------------------------
 
+@st.cache_data(show_spinner=False)
+def _css_payload(css_name: str, mtime_ns: int) -> str:
+    path = Path(__file__).with_name(css_name)
+    return path.read_text(encoding="utf-8") if path.exists() else ""
+
 def _load_css(css_name: str = "demo_ui.css") -> None:
-    """Load CSS from a file next to this script (default: demo_ui.css)."""
+    """Load CSS from a file next to this script (default: demo_ui.css).
+
+    The stylesheet is static, so the text is cached (keyed on mtime) and the
+    markdown payload is sent to the browser once per session rather than
+    being re-serialized on every rerun.
+    """
+    if st.session_state.get("_css_injected"):
+        return
     try:
         css_path = Path(__file__).with_name(css_name)
-        if css_path.exists():
-            st.markdown(f"<style>{css_path.read_text(encoding='utf-8')}</style>", unsafe_allow_html=True)
+        css = _css_payload(css_name, css_path.stat().st_mtime_ns if css_path.exists() else 0)
+        if css:
+            st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
+        st.session_state["_css_injected"] = True
     except Exception:
         # Keep UI functional even if CSS is missing
         pass
 
-from altitude_warning.orchestrator import Orchestrator
-from altitude_warning.simulator import load_scenario_events
+from altitude_warning.simulator import events_from_payload, load_scenario_events
+
+
+@st.cache_data(show_spinner=False)
+def _load_scenario_bundle(path_str: str, mtime_ns: int) -> tuple[dict[str, Any], list[Any]]:
+    """Parse the scenario file once and return (metadata, events).
+
+    main() needs both on every rerun; a shared bundle avoids parsing the
+    same JSON twice. Same (path, mtime_ns) keying as the other loaders.
+    """
+    data = _load_scenario_json_cached(path_str, mtime_ns)
+    events = events_from_payload(data)
+    metadata = {
+        "description": data.get("description", "No description available"),
+        "event_count": len(events),
+        "risk_category": data.get("risk_category", "UNKNOWN"),
+        "faa_guidance": data.get("faa_guidance", ""),
+        "scenario_id": data.get("scenario_id", Path(path_str).stem),
+        "ceiling_ft": data.get("ceiling_ft", None),
+    }
+    return metadata, events
+
+def _load_scenario_events_cached(path_str: str, mtime_ns: int) -> list[Any]:
+    return _load_scenario_bundle(path_str, mtime_ns)[1]
 
 # ----------------------------
 # Scenario discovery utilities
@@ -60,6 +117,16 @@ def get_scenarios_dir() -> Path:
     """
     return Path(__file__).resolve().parents[2] / "data" / "scenarios"
 
+@st.cache_data(show_spinner=False, ttl=60)
+def _existing_files(dirpath: str) -> frozenset[str]:
+    """Names of files in a directory from a single scandir pass."""
+    try:
+        with os.scandir(dirpath) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except FileNotFoundError:
+        return frozenset()
+
+@st.cache_data(show_spinner=False, ttl=60)
 def list_scenario_files() -> list[tuple[str, Path]]:
     """Return list of (display_name, file_path) tuples for available scenarios."""
     scenarios_dir = get_scenarios_dir()
@@ -73,57 +140,115 @@ def list_scenario_files() -> list[tuple[str, Path]]:
         ("Stable Flight (low risk)", "feature1_lowrisk_stable_flight.json"),
     ]
 
+    # One directory read plus set lookups instead of a stat call per file.
+    existing = _existing_files(str(scenarios_dir))
     return [
         (display_name, scenarios_dir / filename)
         for display_name, filename in scenario_files
-        if (scenarios_dir / filename).exists()
+        if filename in existing
     ]
 
-def load_scenario_json(path: Path) -> dict[str, Any]:
+@st.cache_data(show_spinner=False, ttl=60)
+def _scenario_options() -> dict[str, Path]:
+    """Display-name → path mapping, cached with the listing it derives from."""
+    return dict(list_scenario_files())
+
+@st.cache_data(show_spinner=False)
+def _load_scenario_json_cached(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    # mtime_ns keys the cache entry so edits to a scenario file invalidate it.
+    path = Path(path_str)
+    # orjson's C parser pays off on mid-sized scenario files; for tiny files
+    # the FFI overhead dominates, so stick with stdlib json below 4 KiB.
+    if orjson is not None and path.stat().st_size > 4096:
+        return orjson.loads(path.read_bytes())
     with open(path, encoding="utf-8") as f:
         return json.load(f)
 
+def load_scenario_json(path: Path) -> dict[str, Any]:
+    return _load_scenario_json_cached(str(path), path.stat().st_mtime_ns)
+
+@st.cache_data(show_spinner=False)
+def _scan_scenario_metadata(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    # Stream top-level keys and count events without materializing the
+    # events array; only the metadata scalars are kept.
+    scalars: dict[str, Any] = {}
+    event_count = 0
+    with open(path_str, "rb") as f:
+        for prefix, kind, value in ijson.parse(f):
+            if prefix == "events.item" and kind == "start_map":
+                event_count += 1
+            elif kind in ("string", "number", "boolean") and "." not in prefix and prefix:
+                scalars[prefix] = value
+    scalars["event_count"] = event_count
+    return scalars
+
 def load_scenario_metadata(path: Path) -> dict[str, Any]:
-    data = load_scenario_json(path)
+    if ijson is not None:
+        data = _scan_scenario_metadata(str(path), path.stat().st_mtime_ns)
+        event_count = data["event_count"]
+    else:
+        data = load_scenario_json(path)
+        event_count = len(data.get("events", []))
     return {
         "description": data.get("description", "No description available"),
-        "event_count": len(data.get("events", [])),
+        "event_count": event_count,
         "risk_category": data.get("risk_category", "UNKNOWN"),
         "faa_guidance": data.get("faa_guidance", ""),
         "scenario_id": data.get("scenario_id", path.stem),
         "ceiling_ft": data.get("ceiling_ft", None),
     }
 
+# Hoisted so the dict literal isn't rebuilt per call on the rerun path.
+_SCENARIO_MAPPINGS = {
+    "feature1_altitude_breach": "Altitude Breach",
+    "feature1_highriskceilingbreach_gustywind": "High Risk – Ceiling Breach + Gusty Wind",
+    "feature1_highrisklow_ceiling_poorvisibility": "High Risk – Low Ceiling + Poor Visibility",
+    "feature1_highriskrooftop_highwind": "High Risk – Rooftop Operations + High Wind",
+    "feature1_mediumrisk_steady_climb": "Medium Risk – Steady Climb",
+    "feature1_lowrisk_stable_flight": "Low Risk – Stable Flight",
+}
+
+@functools.lru_cache(maxsize=64)
 def format_scenario_name(scenario_id: str) -> str:
-    scenario_mappings = {
-        "feature1_altitude_breach": "Altitude Breach",
-        "feature1_highriskceilingbreach_gustywind": "High Risk – Ceiling Breach + Gusty Wind",
-        "feature1_highrisklow_ceiling_poorvisibility": "High Risk – Low Ceiling + Poor Visibility",
-        "feature1_highriskrooftop_highwind": "High Risk – Rooftop Operations + High Wind",
-        "feature1_mediumrisk_steady_climb": "Medium Risk – Steady Climb",
-        "feature1_lowrisk_stable_flight": "Low Risk – Stable Flight",
-    }
-    if scenario_id in scenario_mappings:
-        return scenario_mappings[scenario_id]
+    if scenario_id in _SCENARIO_MAPPINGS:
+        return _SCENARIO_MAPPINGS[scenario_id]
     return scenario_id.replace("feature1_", "").replace("_", " ").title()
 
 # ----------------------------
 # Orchestrator processing
 # ----------------------------
 
-def process_scenario(
+@st.cache_resource(show_spinner=False)
+def _get_orchestrator(enable_retrieval: bool):
+    """One orchestrator per retrieval mode; graph compilation and client
+    construction are too expensive to repeat on every Analyze click.
+
+    The import is deferred so browsing telemetry plots never pays the
+    LangGraph/LangChain import cost at app start.
+    """
+    from altitude_warning.orchestrator import Orchestrator
+
+    return Orchestrator(trace_enabled=True, enable_policy_retrieval=enable_retrieval)
+
+def process_scenario_stream(
     scenario_path: Path,
     progress_callback=None,
     enable_retrieval: bool = False,
-) -> list[dict[str, Any]]:
-    orchestrator = Orchestrator(trace_enabled=True, enable_policy_retrieval=enable_retrieval)
+    max_concurrency: int = 4,
+):
+    """Yield per-event results in input order as soon as each completes.
+
+    Events still run concurrently under a semaphore; awaiting the tasks in
+    order means the first card can render after the first event instead of
+    after the whole batch. Sweep CSV rows are appended as results arrive.
+    """
+    orchestrator = _get_orchestrator(enable_retrieval)
     events = load_scenario_events(scenario_path)
 
     import csv
     from datetime import datetime, timezone
     from pathlib import Path
 
-    results: list[dict[str, Any]] = []
     # Prepare CSV output
     output_dir = Path("outputs")
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -148,45 +273,73 @@ def process_scenario(
         "latency_ms",
         "rationale",
     ]
-    with csv_path.open("w", newline="", encoding="utf-8") as fh:
-        writer = csv.DictWriter(fh, fieldnames=fieldnames)
-        writer.writeheader()
-        for idx, event in enumerate(events, start=1):
-            if progress_callback:
-                progress_callback(idx, len(events), f"Processing Event {idx}/{len(events)}: {event.drone_id}")
-
-            decision, assessment, policy_context, latency_ms = orchestrator.process_event(event)
-            results.append(
-                {
+
+    loop = asyncio.new_event_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _bounded(event):
+        async with semaphore:
+            return await orchestrator.aprocess_event(event)
+
+    tasks = [loop.create_task(_bounded(event)) for event in events]
+    try:
+        with csv_path.open("w", newline="", encoding="utf-8") as fh:
+            writer = csv.DictWriter(fh, fieldnames=fieldnames)
+            writer.writeheader()
+            for idx, (event, task) in enumerate(zip(events, tasks), start=1):
+                decision, assessment, policy_context, latency_ms = loop.run_until_complete(task)
+                if progress_callback:
+                    progress_callback(idx, len(events), f"Processed Event {idx}/{len(events)}: {event.drone_id}")
+                # Write row to CSV
+                writer.writerow({
+                    "scenario_id": getattr(event, "scenario_id", "demo"),
+                    "risk_category": getattr(event, "risk_category", "UNKNOWN"),
+                    "drone_id": getattr(event, "drone_id", ""),
+                    "altitude_ft": getattr(event, "altitude_ft", ""),
+                    "ceiling_ft": getattr(assessment, "ceiling_ft", ""),
+                    "vertical_speed_fps": getattr(event, "vertical_speed_fps", ""),
+                    "wind_mps": getattr(event, "wind_mps", "N/A"),
+                    "gust_mps": getattr(event, "gust_mps", "N/A"),
+                    "visibility_km": getattr(event, "visibility_km", "N/A"),
+                    "route": getattr(decision, "route", ""),
+                    "risk_band": getattr(decision, "risk_band", ""),
+                    "risk_score": f"{getattr(assessment, 'risk_score', 0.0):.3f}",
+                    "confidence": f"{getattr(assessment, 'confidence', 0.0):.3f}",
+                    "should_alert": getattr(decision, "should_alert", ""),
+                    "policy_chunks_retrieved": len(policy_context) if policy_context else 0,
+                    "latency_ms": f"{latency_ms:.0f}",
+                    "rationale": (getattr(decision, "rationale", "")[:100] if getattr(decision, "rationale", None) else ""),
+                })
+                yield {
                     "event": event,
                     "decision": decision,
                     "assessment": assessment,
                     "latency_ms": latency_ms,
                 }
-            )
-            # Write row to CSV
-            writer.writerow({
-                "scenario_id": getattr(event, "scenario_id", "demo"),
-                "risk_category": getattr(event, "risk_category", "UNKNOWN"),
-                "drone_id": getattr(event, "drone_id", ""),
-                "altitude_ft": getattr(event, "altitude_ft", ""),
-                "ceiling_ft": getattr(assessment, "ceiling_ft", ""),
-                "vertical_speed_fps": getattr(event, "vertical_speed_fps", ""),
-                "wind_mps": getattr(event, "wind_mps", "N/A"),
-                "gust_mps": getattr(event, "gust_mps", "N/A"),
-                "visibility_km": getattr(event, "visibility_km", "N/A"),
-                "route": getattr(decision, "route", ""),
-                "risk_band": getattr(decision, "risk_band", ""),
-                "risk_score": f"{getattr(assessment, 'risk_score', 0.0):.3f}",
-                "confidence": f"{getattr(assessment, 'confidence', 0.0):.3f}",
-                "should_alert": getattr(decision, "should_alert", ""),
-                "policy_chunks_retrieved": len(policy_context) if policy_context else 0,
-                "latency_ms": f"{latency_ms:.0f}",
-                "rationale": (getattr(decision, "rationale", "")[:100] if getattr(decision, "rationale", None) else ""),
-            })
-    return results
+    finally:
+        for task in tasks:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        loop.close()
 
+def process_scenario(
+    scenario_path: Path,
+    progress_callback=None,
+    enable_retrieval: bool = False,
+    max_concurrency: int = 4,
+) -> list[dict[str, Any]]:
+    return list(
+        process_scenario_stream(
+            scenario_path,
+            progress_callback=progress_callback,
+            enable_retrieval=enable_retrieval,
+            max_concurrency=max_concurrency,
+        )
+    )
+
+@functools.lru_cache(maxsize=1)
 def is_langsmith_enabled() -> bool:
+    # The env var doesn't change mid-process; skip repeated getenv in renders.
     return bool(os.getenv("LANGCHAIN_API_KEY"))
 
 # ----------------------------
@@ -195,12 +348,16 @@ def is_langsmith_enabled() -> bool:
 
 def _is_empty(val: Any) -> bool:
     """Treat None, empty string, and empty containers as empty. 0 is NOT empty."""
+    # Exact type checks instead of isinstance: this runs per field per event
+    # in the hover loop, and identity tests skip the MRO walk for the common
+    # scalar (int/float) path.
     if val is None:
         return True
-    if isinstance(val, str) and val.strip() == "":
-        return True
-    if isinstance(val, (list, dict, tuple, set)) and len(val) == 0:
-        return True
+    t = type(val)
+    if t is str:
+        return not val or val.isspace()
+    if t is list or t is dict or t is tuple or t is set:
+        return not val
     return False
 
 def _maybe_caption(label: str, val: Any, fmt: Optional[str] = None) -> None:
@@ -216,18 +373,46 @@ def _maybe_caption(label: str, val: Any, fmt: Optional[str] = None) -> None:
 # Interactive telemetry plot
 # ----------------------------
 
+# Hover fields in display order; hoisted so the per-event loop doesn't
+# rebuild the key list for every event.
+_HOVER_KEYS = (
+    "drone_id",
+    "altitude_ft",
+    "vertical_speed_fps",
+    "ground_speed_fps",
+    "heading_deg",
+    "wind_mps",
+    "gust_mps",
+)
+
+@functools.lru_cache(maxsize=4096)
 def _parse_ts(ts: str) -> datetime:
-    # Handles timestamps like "2026-02-13T20:00:00Z"
+    # Handles timestamps like "2026-02-13T20:00:00Z". The same timestamps are
+    # re-parsed on every Play frame and rerun, so memoize by string, and take
+    # a fixed-offset slicing path for the exact 20-char Zulu format rather
+    # than the generic fromisoformat parser.
+    if len(ts) == 20 and ts[-1] == "Z":
+        return datetime(
+            int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+            int(ts[11:13]), int(ts[14:16]), int(ts[17:19]),
+            tzinfo=timezone.utc,
+        )
     if ts.endswith("Z"):
         ts = ts[:-1] + "+00:00"
     return datetime.fromisoformat(ts).astimezone(timezone.utc)
 
-def _project_altitudes(event: Any, horizon_s: int = 8, step_s: int = 1) -> tuple[list[int], list[float]]:
-    dts = list(range(0, max(1, horizon_s) + 1, max(1, step_s)))
+@functools.lru_cache(maxsize=256)
+def _projection(alt0: float, vz: float, horizon_s: int, step_s: int) -> tuple[np.ndarray, np.ndarray]:
+    # One vectorized multiply-add; Plotly accepts the arrays directly.
+    # Cached on the scalar inputs since the same event is projected on every
+    # rerun; callers treat the returned arrays as read-only.
+    dts = np.arange(0, max(1, horizon_s) + 1, max(1, step_s), dtype=np.int32)
+    return dts, alt0 + vz * dts
+
+def _project_altitudes(event: Any, horizon_s: int = 8, step_s: int = 1) -> tuple[np.ndarray, np.ndarray]:
     alt0 = float(getattr(event, "altitude_ft", 0.0) or 0.0)
     vz = float(getattr(event, "vertical_speed_fps", 0.0) or 0.0)
-    proj = [alt0 + vz * dt for dt in dts]
-    return dts, proj
+    return _projection(alt0, vz, horizon_s, step_s)
 
 def _event_label(i: int, e: Any) -> str:
     ts = getattr(e, "timestamp_iso", "")
@@ -246,13 +431,21 @@ def _event_label(i: int, e: Any) -> str:
         parts.append(f"vz={vz}ft/s")
     return " • ".join(parts)
 
-def render_telemetry_plot(
-    events: list[Any],
+@st.cache_data(show_spinner=False)
+def _build_base_fig(
+    path_str: str,
+    mtime_ns: int,
     selected_idx: int,
     ceiling_ft: float,
-    highlight_dt: Optional[int] = None,
-) -> go.Figure:
-    """Build Plotly figure. Optionally highlight a moving marker along the projection."""
+) -> tuple[go.Figure, list[datetime], np.ndarray]:
+    """Build the static parts of the telemetry figure (history, selected
+    marker, projection, ceiling) plus the projection coordinates.
+
+    Cached per (scenario, event, ceiling); st.cache_data hands back a copy,
+    so callers may mutate the returned figure freely. Only the playback
+    marker changes during Play, and that is overlaid separately.
+    """
+    events = _load_scenario_events_cached(path_str, mtime_ns)
     xs = []
     ys = []
     hover = []
@@ -261,13 +454,13 @@ def render_telemetry_plot(
         xs.append(t)
         ys.append(float(getattr(e, "altitude_ft", 0.0) or 0.0))
 
-        # Only include non-empty fields in hover
-        lines = []
-        for k in ["drone_id", "altitude_ft", "vertical_speed_fps", "ground_speed_fps", "heading_deg", "wind_mps", "gust_mps"]:
-            v = getattr(e, k, None)
-            if not _is_empty(v):
-                lines.append(f"{k}={v}")
-        hover.append("<br>".join(lines) if lines else "Telemetry snapshot")
+        # Only include non-empty fields in hover. Events are slotted
+        # dataclasses (no __dict__), so getattr with a default stays; the
+        # single join over a generator avoids the per-event list build.
+        text = "<br>".join(
+            f"{k}={v}" for k in _HOVER_KEYS if not _is_empty(v := getattr(e, k, None))
+        )
+        hover.append(text or "Telemetry snapshot")
 
     idx = max(0, min(selected_idx, len(events) - 1))
     e0 = events[idx]
@@ -314,23 +507,12 @@ def render_telemetry_plot(
         )
     )
 
-    # Moving marker along projection (for Play)
-    if highlight_dt is not None:
-        dt_i = max(0, min(int(highlight_dt), len(dts) - 1))
-        fig.add_trace(
-            go.Scatter(
-                x=[proj_x[dt_i]],
-                y=[proj[dt_i]],
-                mode="markers",
-                name="Drone (playback)",
-                marker=dict(size=14),
-                hoverinfo="skip",
-            )
-        )
-
-    # Ceiling line
-    xmin = min(xs + [t0])
-    xmax = max(xs + [proj_x[-1]])
+    # Ceiling line. Compare scalars directly rather than min/max over
+    # freshly concatenated N+1 element lists.
+    xs_min = min(xs)
+    xs_max = max(xs)
+    xmin = xs_min if xs_min < t0 else t0
+    xmax = xs_max if xs_max > proj_x[-1] else proj_x[-1]
     fig.add_trace(
         go.Scatter(
             x=[xmin, xmax],
@@ -350,8 +532,95 @@ def render_telemetry_plot(
         hovermode="x unified",
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
     )
+    return fig, proj_x, proj
+
+def _overlay_playback(
+    fig: go.Figure,
+    highlight_dt: Optional[int],
+    proj_x: list[datetime],
+    proj: np.ndarray,
+) -> go.Figure:
+    """Add or move the playback marker; the rest of the figure is untouched."""
+    if highlight_dt is None:
+        return fig
+    dt_i = max(0, min(int(highlight_dt), len(proj) - 1))
+    if fig.data and fig.data[-1].name == "Drone (playback)":
+        fig.data[-1].x = [proj_x[dt_i]]
+        fig.data[-1].y = [proj[dt_i]]
+    else:
+        fig.add_trace(
+            go.Scatter(
+                x=[proj_x[dt_i]],
+                y=[proj[dt_i]],
+                mode="markers",
+                name="Drone (playback)",
+                marker=dict(size=14),
+                hoverinfo="skip",
+            )
+        )
+    return fig
+
+def _attach_playback_animation(
+    fig: go.Figure,
+    proj_x: list[datetime],
+    proj: np.ndarray,
+    frame_duration_ms: int = 180,
+) -> go.Figure:
+    """Attach client-side playback frames and a Play button to the figure.
+
+    The browser's Plotly runtime animates the marker along the projection,
+    so no server reruns or sleeps are needed during playback.
+    """
+    _overlay_playback(fig, 0, proj_x, proj)
+    marker_trace_idx = len(fig.data) - 1
+    fig.frames = [
+        go.Frame(
+            data=[go.Scatter(x=[proj_x[i]], y=[proj[i]])],
+            traces=[marker_trace_idx],
+            name=str(i),
+        )
+        for i in range(len(proj))
+    ]
+    fig.update_layout(
+        updatemenus=[
+            dict(
+                type="buttons",
+                direction="left",
+                x=0.0,
+                y=1.15,
+                xanchor="left",
+                yanchor="top",
+                buttons=[
+                    dict(
+                        label="▶ Play (up to 8 seconds)",
+                        method="animate",
+                        args=[
+                            None,
+                            dict(
+                                frame=dict(duration=frame_duration_ms, redraw=False),
+                                transition=dict(duration=0),
+                                fromcurrent=False,
+                            ),
+                        ],
+                    ),
+                ],
+            )
+        ]
+    )
     return fig
 
+def render_telemetry_plot(
+    scenario_path: Path,
+    selected_idx: int,
+    ceiling_ft: float,
+    highlight_dt: Optional[int] = None,
+) -> go.Figure:
+    """Build the telemetry figure, optionally with the playback marker."""
+    fig, proj_x, proj = _build_base_fig(
+        str(scenario_path), scenario_path.stat().st_mtime_ns, selected_idx, ceiling_ft
+    )
+    return _overlay_playback(fig, highlight_dt, proj_x, proj)
+
 # ----------------------------
 # Trace + decision card UI (minimal)
 # ----------------------------
@@ -359,8 +628,11 @@ def render_telemetry_plot(
 def get_trace_statistics(results: list[dict[str, Any]]) -> dict[str, Any]:
     if not results:
         return {}
-    all_steps = []
-    step_timings: dict[str, list[float]] = {}
+    # Single accumulation pass holding running [count, sum, min, max] per
+    # step, so neither the averages nor any downstream min/max need a second
+    # walk over per-step timing lists.
+    step_stats: dict[str, list[float]] = {}
+    total_steps = 0
 
     for result in results:
         decision = result["decision"]
@@ -369,16 +641,25 @@ def get_trace_statistics(results: list[dict[str, Any]]) -> dict[str, Any]:
         for step in decision.trace:
             step_name = step.get("name", "unknown")
             duration_ms = step.get("duration_ms", 0)
-            all_steps.append((step_name, duration_ms))
-            step_timings.setdefault(step_name, []).append(duration_ms)
+            stats = step_stats.get(step_name)
+            if stats is None:
+                step_stats[step_name] = [1, duration_ms, duration_ms, duration_ms]
+            else:
+                stats[0] += 1
+                stats[1] += duration_ms
+                if duration_ms < stats[2]:
+                    stats[2] = duration_ms
+                if duration_ms > stats[3]:
+                    stats[3] = duration_ms
+            total_steps += 1
 
     total_latency_ms = sum(r["latency_ms"] for r in results)
     return {
         "total_events": len(results),
-        "total_steps": len(all_steps),
+        "total_steps": total_steps,
         "total_latency_ms": total_latency_ms,
-        "step_timings": step_timings,
-        "step_average_timings": {k: (sum(v) / len(v)) for k, v in step_timings.items()},
+        "step_stats": step_stats,
+        "step_average_timings": {k: s[1] / s[0] for k, s in step_stats.items()},
     }
 
 def render_trace_analysis_tab(results: list[dict[str, Any]], show_langsmith: bool = False) -> None:
@@ -399,6 +680,20 @@ def render_trace_analysis_tab(results: list[dict[str, Any]], show_langsmith: boo
         avg = stats["total_latency_ms"] / max(1, stats["total_events"])
         st.metric("Avg/Event", f"{avg:.2f} ms")
 
+    # Per-step stats as one dataframe widget rather than a metric per step;
+    # the running [count, sum, min, max] tuples come straight from the
+    # single-pass aggregation.
+    if stats["step_stats"]:
+        st.markdown("### Step timings")
+        step_df = pd.DataFrame(
+            [
+                (name, int(s[0]), s[2], s[3], s[1] / s[0])
+                for name, s in stats["step_stats"].items()
+            ],
+            columns=["Step", "Invocations", "Min (ms)", "Max (ms)", "Avg (ms)"],
+        ).sort_values("Avg (ms)", ascending=False)
+        st.dataframe(step_df, use_container_width=True, hide_index=True)
+
 
     if show_langsmith and is_langsmith_enabled():
         langsmith_url = "https://smith.langchain.com"
@@ -414,25 +709,29 @@ def render_trace_analysis_tab(results: list[dict[str, Any]], show_langsmith: boo
             if not trace:
                 st.info("No trace available for this event.")
                 continue
+            # One markdown payload per event: each st.markdown is a wire
+            # message, and the old per-step/per-field calls multiplied out
+            # to dozens of them per expander.
+            lines: list[str] = []
             for step_num, step in enumerate(trace, start=1):
                 step_name = step.get("name", "unknown")
                 duration = step.get("duration_ms", 0)
                 inputs = step.get("inputs", {})
                 outputs = step.get("outputs", {})
-                st.markdown(f"**Step {step_num}: {step_name}**  ")
-                st.markdown(f"- Duration: `{duration:.2f} ms`")
+                lines.append(f"**Step {step_num}: {step_name}**  ")
+                lines.append(f"- Duration: `{duration:.2f} ms`")
                 if inputs:
-                    st.markdown("  - Inputs:")
-                    for k, v in inputs.items():
-                        st.markdown(f"    - `{k}`: `{v}`")
+                    lines.append("  - Inputs:")
+                    lines.extend(f"    - `{k}`: `{v}`" for k, v in inputs.items())
                 if outputs:
-                    st.markdown("  - Outputs:")
+                    lines.append("  - Outputs:")
                     for k, v in outputs.items():
                         if k == "rationale":
-                            st.markdown(f"    - <span style='color: #228B22; font-weight: bold;'>`{k}`: `{v}`</span>", unsafe_allow_html=True)
+                            lines.append(f"    - <span style='color: #228B22; font-weight: bold;'>`{k}`: `{v}`</span>")
                         else:
-                            st.markdown(f"    - `{k}`: `{v}`")
-                st.markdown("---")
+                            lines.append(f"    - `{k}`: `{v}`")
+                lines.append("---")
+            st.markdown("\n".join(lines), unsafe_allow_html=True)
 
 def render_decision_card(result: dict[str, Any], event_num: int) -> None:
     decision = result["decision"]
@@ -458,16 +757,66 @@ def render_decision_card(result: dict[str, Any], event_num: int) -> None:
             st.markdown("Decision message")
             st.info(getattr(decision, "message", ""), icon="ℹ️")
 
-        st.markdown("Telemetry")
-        _maybe_caption("Altitude (ft AGL)", getattr(event, "altitude_ft", None))
-        _maybe_caption("Vertical speed (ft/s)", getattr(event, "vertical_speed_fps", None))
-        _maybe_caption("Predicted (ft)", getattr(assessment, "predicted_altitude_ft", None), fmt=".1f")
-        _maybe_caption("Ceiling (ft)", getattr(assessment, "ceiling_ft", None), fmt=".0f")
+        # One markdown block instead of a caption per field: each Streamlit
+        # call is a frontend message, and cards render in a loop per event.
+        lines = ["Telemetry"]
+        for label, val, fmt in [
+            ("Altitude (ft AGL)", getattr(event, "altitude_ft", None), None),
+            ("Vertical speed (ft/s)", getattr(event, "vertical_speed_fps", None), None),
+            ("Predicted (ft)", getattr(assessment, "predicted_altitude_ft", None), ".1f"),
+            ("Ceiling (ft)", getattr(assessment, "ceiling_ft", None), ".0f"),
+        ]:
+            if _is_empty(val):
+                continue
+            if fmt is not None and isinstance(val, (int, float)):
+                lines.append(f"- {label}: {val:{fmt}}")
+            else:
+                lines.append(f"- {label}: {val}")
+        st.markdown("\n".join(lines))
 
 # ----------------------------
 # Main UI
 # ----------------------------
 
+@st.fragment
+def _telemetry_section(selected_path: Path, ceiling_ft: float) -> None:
+    """Telemetry plot section; fragment scope keeps event selection and
+    playback reruns from re-executing the orchestrator UI below."""
+    with st.expander("Telemetry & linear projection", expanded=True):
+        events = _load_scenario_events_cached(str(selected_path), selected_path.stat().st_mtime_ns)
+        if not events:
+            st.info("Scenario has no telemetry events.")
+            return
+
+        # Event dropdown (instead of slider); the selectbox returns the index
+        # directly, so no label list or label-to-index dict per rerun.
+        selected_event_idx = st.selectbox(
+            "Select event",
+            options=range(len(events)),
+            index=0,
+            format_func=lambda i: _event_label(i, events[i]),
+        )
+
+        st.caption("Hover points for details. The dashed line is the linear projection; the red dashed line is the ceiling. Use the Play button on the chart to animate the projection.")
+
+        # Playback runs client-side via Plotly frames: one render, no server
+        # reruns or sleeps while the marker animates along the projection.
+        fig, proj_x, proj = _build_base_fig(
+            str(selected_path), selected_path.stat().st_mtime_ns, selected_event_idx, ceiling_ft
+        )
+        # A flat projection (vertical speed ~ 0) would animate nine identical
+        # frames; skip the playback machinery and say so instead.
+        if abs(float(proj[-1]) - float(proj[0])) < 1e-6:
+            st.caption("Vertical speed ≈ 0 for this event; the projection is flat, so playback is disabled.")
+        else:
+            _attach_playback_animation(fig, proj_x, proj)
+        st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": True})
+
+@st.fragment
+def _trace_analysis_fragment(results: list[dict[str, Any]]) -> None:
+    """Trace tab as a fragment so toggling its controls skips reprocessing."""
+    render_trace_analysis_tab(results, show_langsmith=st.session_state.get("show_langsmith", False))
+
 def main() -> None:
     st.set_page_config(page_title="sUAS Telemetry to Risk Decision Workflow", page_icon="🚁", layout="wide")
     _load_css("demo_ui.css")
@@ -476,13 +825,16 @@ def main() -> None:
     st.caption("Scenario-based telemetry to policy-constrained risk decisions")
     st.divider()
 
+    with st.sidebar:
+        if st.button("Reset orchestrator", help="Drop the cached orchestrator and rebuild it on the next run"):
+            _get_orchestrator.clear()
+
     # --- Scenario selection (single source of truth) ---
-    scenarios = list_scenario_files()
-    if not scenarios:
+    scenario_options = _scenario_options()
+    if not scenario_options:
         st.error("No scenario files found in data/scenarios/")
         return
 
-    scenario_options = {display_name: path for display_name, path in scenarios}
     scenario_names = list(scenario_options.keys())
 
     SCENARIO_KEY = "selected_scenario_name"
@@ -501,57 +853,11 @@ def main() -> None:
     selected_name = st.session_state[SCENARIO_KEY]
     selected_path = scenario_options[selected_name]
 
-    metadata = load_scenario_metadata(selected_path)
+    metadata, _events = _load_scenario_bundle(str(selected_path), selected_path.stat().st_mtime_ns)
     ceiling_ft = float(metadata["ceiling_ft"] or 300.0)
     # Telemetry plot (no orchestrator needed)
     st.divider()
-    with st.expander("Telemetry & linear projection", expanded=True):
-        events = load_scenario_events(selected_path)
-        if not events:
-            st.info("Scenario has no telemetry events.")
-            return
-
-        # Event dropdown (instead of slider)
-        labels = [_event_label(i, e) for i, e in enumerate(events)]
-        label_to_idx = {labels[i]: i for i in range(len(labels))}
-        selected_label = st.selectbox("Select event", options=labels, index=0)
-        selected_event_idx = label_to_idx[selected_label]
-
-        # Playback controls (just for telemetry section)
-        if "telemetry_play_dt" not in st.session_state:
-            st.session_state["telemetry_play_dt"] = None
-
-        colA, colB, colC = st.columns([1, 1, 3])
-        with colC:
-            st.caption("Hover points for details. The dashed line is the linear projection; the red dashed line is the ceiling.")
-        with colA:
-            play = st.button("▶ Play (up to 8 seconds)", use_container_width=True)
-        with colB:
-            reset = st.button("⟲ Reset", use_container_width=True)
-
-        if reset:
-            st.session_state["telemetry_play_dt"] = None
-
-        chart_ph = st.empty()
-
-        if play:
-            # Frame-by-frame update (9 frames). This blocks briefly but is reliable for a demo.
-            import time
-            for dt in range(0, 9):
-                fig = render_telemetry_plot(events, selected_event_idx, ceiling_ft=ceiling_ft, highlight_dt=dt)
-                chart_ph.plotly_chart(fig, use_container_width=True, config={"displayModeBar": True})
-                time.sleep(0.18)
-            st.session_state["telemetry_play_dt"] = 8
-
-        # If not playing, render static chart (or the last frame after play)
-        if not play:
-            fig = render_telemetry_plot(
-                events,
-                selected_event_idx,
-                ceiling_ft=ceiling_ft,
-                highlight_dt=st.session_state.get("telemetry_play_dt", None),
-            )
-            chart_ph.plotly_chart(fig, use_container_width=True, config={"displayModeBar": True})
+    _telemetry_section(selected_path, ceiling_ft)
 
     # Orchestrator section
     st.divider()
@@ -575,16 +881,33 @@ def main() -> None:
         progress_bar = st.progress(0)
         status_text = st.empty()
 
+        # Throttle to ~20 updates/sec: each progress tick is a websocket
+        # message, and large scenarios would otherwise flood the frontend.
+        last_update = [0.0]
+
         def update_progress(event_num: int, total: int, message: str) -> None:
-            progress_bar.progress(event_num / max(total, 1))
-            status_text.text(message)
+            now = time.monotonic()
+            if event_num == total or now - last_update[0] > 0.05:
+                progress_bar.progress(event_num / max(total, 1))
+                status_text.text(message)
+                last_update[0] = now
+
+        # Live area re-rendered per arriving result, then cleared so the
+        # Results tab below stays the single copy of the cards.
+        live_cards = st.empty()
 
         try:
-            results = process_scenario(
+            results: list[dict[str, Any]] = []
+            for result in process_scenario_stream(
                 selected_path,
                 progress_callback=update_progress,
                 enable_retrieval=enable_retrieval,
-            )
+            ):
+                results.append(result)
+                with live_cards.container():
+                    for idx, done in enumerate(results, start=1):
+                        render_decision_card(done, idx)
+            live_cards.empty()
             st.session_state["results"] = results
             st.session_state["scenario_path"] = str(selected_path)
             progress_bar.progress(1.0)
@@ -598,10 +921,33 @@ def main() -> None:
         results = st.session_state["results"]
         tab1, tab2 = st.tabs(["Results", "Trace analysis"])
         with tab1:
+            # Columnar views of the results: numeric aggregates reduce at
+            # C level instead of looping over dataclass attributes.
+            latency = np.fromiter(
+                (r["latency_ms"] for r in results), dtype=np.float32, count=len(results)
+            )
+            alerts = np.fromiter(
+                (bool(r["decision"].should_alert) for r in results), dtype=bool, count=len(results)
+            )
+            route_counts = Counter(r["decision"].route for r in results)
+            alert_count = int(alerts.sum())
+            avg_latency_ms = float(latency.mean()) if len(results) else 0.0
+
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Alerts", alert_count)
+            with col2:
+                st.metric("Avg Latency", f"{avg_latency_ms:.0f} ms")
+            with col3:
+                st.metric(
+                    "Routes",
+                    ", ".join(f"{route}: {count}" for route, count in route_counts.most_common()),
+                )
+
             for idx, result in enumerate(results, start=1):
                 render_decision_card(result, idx)
         with tab2:
-            render_trace_analysis_tab(results, show_langsmith=st.session_state.get("show_langsmith", False))
+            _trace_analysis_fragment(results)
 
 if __name__ == "__main__":
     main()
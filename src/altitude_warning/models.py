@@ -1,8 +1,14 @@
-from dataclasses import dataclass, field
+import json
+from dataclasses import asdict, dataclass, field
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+try:
+    import msgspec
+except ModuleNotFoundError:  # pragma: no cover - msgspec optional
+    msgspec = None
+
 
 @dataclass(slots=True)
 class TelemetryEvent:
@@ -46,6 +52,76 @@ class LLMAssessment(BaseModel):
     confidence: float
 
 
+class FusedAssessDecision(BaseModel):
+    """Combined assess + decide output for the single-call fused path."""
+
+    predicted_altitude_ft: float
+    ceiling_ft: float
+    risk_score: float
+    confidence: float
+    route: str = Field(..., description="auto_notify | hitl_review | monitor")
+    risk_band: str = Field(..., description="LOW | MED | HIGH")
+    should_alert: bool
+    rationale: str
+
+
+class BatchAssessDecision(BaseModel):
+    """Row-marshaled results for several independent events in one LLM call."""
+
+    results: list[FusedAssessDecision]
+
+
+if msgspec is not None:
+
+    class EventPayload(msgspec.Struct, omit_defaults=True):
+        """Schema-specialized output record shared by the CLI and API emitters."""
+
+        drone_id: str
+        route: str
+        status: str
+        message: str
+        risk_band: str
+        rationale: str | None
+        risk_score: float
+        confidence: float
+        predicted_altitude_ft: float
+        ceiling_ft: float
+        latency_ms: float
+        trace_id: str | None = None
+        trace: list[dict[str, Any]] | None = None
+
+    _EVENT_PAYLOAD_ENCODER = msgspec.json.Encoder()
+
+    def encode_event_payload(payload: EventPayload) -> bytes:
+        return _EVENT_PAYLOAD_ENCODER.encode(payload)
+
+else:  # pragma: no cover - dict/json fallback when msgspec is missing
+
+    @dataclass(slots=True)
+    class EventPayload:
+        drone_id: str
+        route: str
+        status: str
+        message: str
+        risk_band: str
+        rationale: str | None
+        risk_score: float
+        confidence: float
+        predicted_altitude_ft: float
+        ceiling_ft: float
+        latency_ms: float
+        trace_id: str | None = None
+        trace: list[dict[str, Any]] | None = None
+
+    def encode_event_payload(payload: EventPayload) -> bytes:
+        data = asdict(payload)
+        # Match msgspec's omit_defaults behavior for the optional trace fields.
+        for key in ("trace_id", "trace"):
+            if data[key] is None:
+                del data[key]
+        return json.dumps(data).encode("utf-8")
+
+
 @dataclass(slots=True)
 class AlertDecision:
     drone_id: str
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 import re
+import sys
 from pathlib import Path
-from typing import Callable, Iterable, Sequence
+from typing import Callable, Iterable, Iterator, Sequence
 
 from langchain_openai import OpenAIEmbeddings
 from pypdf import PdfReader
+from weaviate.classes.config import ConsistencyLevel
 from weaviate.collections.classes.data import DataObject
 
 from altitude_warning.policy.weaviate_client import DEFAULT_COLLECTION, ensure_policy_collection, get_client
@@ -22,86 +28,175 @@ class PolicyChunk:
     structure: str = "body"
 
 
-_SECTION_PATTERN = re.compile(r"^(chapter|appendix|section)\\b", re.IGNORECASE)
+_SECTION_PATTERN = re.compile(r"^(chapter|appendix|section)\b", re.IGNORECASE)
+
+# Single alternation so structure detection is one regex scan per chunk
+# instead of five separate substring passes; group priority is resolved
+# after the scan.
+_STRUCTURE_RE = re.compile(
+    r"(?P<toc>table of contents)"
+    r"|(?P<appendix>appendix|appendices)"
+    r"|(?P<acr>acr)"
+    r"|(?P<definition>definition)"
+    r"|(?P<glossary>glossary)"
+)
 
 
 def _guess_section_title(text: str) -> str | None:
+    # Interned: overlapping chunk windows repeat the same header line many
+    # times, so duplicates collapse to one string object per title.
     for raw_line in text.splitlines():
         line = raw_line.strip()
         if not line:
             continue
         if _SECTION_PATTERN.match(line):
-            return line
-        if line.isupper() and 4 <= len(line) <= 80:
-            return line
+            return sys.intern(line)
+        if 4 <= len(line) <= 80 and line.isupper():
+            return sys.intern(line)
     return None
 
 
 def _detect_structure_label(text: str) -> str:
     lowered = text.lower()
-    if "table of contents" in lowered:
-        return "toc"
-    leading = lowered[:200]
-    if leading.startswith("appendix") or leading.startswith("appendices"):
-        return "appendix"
-    if " appendix" in leading:
+    saw_appendix = saw_acr = saw_definition = saw_glossary = False
+    for match in _STRUCTURE_RE.finditer(lowered):
+        group = match.lastgroup
+        if group == "toc":
+            return "toc"
+        if group == "appendix":
+            # Appendix headers only count near the top of the chunk.
+            if match.start() < 200:
+                saw_appendix = True
+        elif group == "acr":
+            saw_acr = True
+        elif group == "definition":
+            saw_definition = True
+        else:
+            saw_glossary = True
+    if saw_appendix:
         return "appendix"
-    if "acr" in lowered and "definition" in lowered:
+    if saw_acr and saw_definition:
         return "reference"
-    if "glossary" in lowered:
+    if saw_glossary:
         return "reference"
     return "body"
 
 
-def load_pdf_pages(path: Path) -> list[tuple[int, str]]:
+def _extract_page_text(path_str: str, index: int) -> str:
+    # Runs in a worker process: each worker opens its own reader because
+    # PdfReader objects do not pickle across process boundaries.
+    reader = PdfReader(path_str)
+    return reader.pages[index].extract_text() or ""
+
+
+def iter_pdf_pages(path: Path) -> Iterator[tuple[int, str]]:
+    """Yield (page_number, text) one page at a time.
+
+    Streaming keeps peak memory at one page of text instead of the whole
+    manual while chunking and ingestion run downstream. Text extraction is
+    CPU-bound pure Python, so setting POLICY_INGEST_WORKERS > 1 fans pages
+    out to a process pool (threads would just contend on the GIL); results
+    still arrive in page order.
+    """
+    workers = int(os.getenv("POLICY_INGEST_WORKERS", "0"))
     reader = PdfReader(str(path))
-    pages: list[tuple[int, str]] = []
-    for idx, page in enumerate(reader.pages, start=1):
-        pages.append((idx, page.extract_text() or ""))
-    return pages
+    if workers <= 1:
+        for idx, page in enumerate(reader.pages, start=1):
+            yield (idx, page.extract_text() or "")
+        return
+    page_count = len(reader.pages)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        texts = pool.map(partial(_extract_page_text, str(path)), range(page_count))
+        yield from enumerate(texts, start=1)
+
+
+def load_pdf_pages(path: Path) -> list[tuple[int, str]]:
+    return list(iter_pdf_pages(path))
+
+
+_WORD_PATTERN = re.compile(r"\S+")
 
 
 def chunk_text(text: str, chunk_size: int = 350, overlap: int = 80) -> list[str]:
-    words = text.split()
-    if not words:
+    # Record word offsets and slice the original string per window instead
+    # of split()/join(), which copies every word once per overlapping chunk.
+    if chunk_size <= overlap:
+        raise ValueError("chunk_size must exceed overlap")
+    spans = [match.span() for match in _WORD_PATTERN.finditer(text)]
+    if not spans:
         return []
+    n = len(spans)
+    step = chunk_size - overlap
     chunks: list[str] = []
     start = 0
-    while start < len(words):
-        end = min(len(words), start + chunk_size)
-        chunks.append(" ".join(words[start:end]))
-        if end == len(words):
+    while True:
+        end = start + chunk_size
+        if end >= n:
+            chunks.append(text[spans[start][0] : spans[n - 1][1]])
             break
-        start = max(0, end - overlap)
+        chunks.append(text[spans[start][0] : spans[end - 1][1]])
+        start += step
     return chunks
 
 
-def build_chunks(pages: Iterable[tuple[int, str]], source: str) -> list[PolicyChunk]:
-    chunks: list[PolicyChunk] = []
+def build_chunks(pages: Iterable[tuple[int, str]], source: str) -> Iterator[PolicyChunk]:
     chunk_index = 0
     for page_number, text in pages:
         for chunk in chunk_text(text):
-            chunks.append(
-                PolicyChunk(
-                    text=chunk,
-                    source=source,
-                    page=page_number,
-                    chunk_index=chunk_index,
-                    section_title=_guess_section_title(chunk),
-                    structure=_detect_structure_label(chunk),
-                )
+            yield PolicyChunk(
+                text=chunk,
+                source=source,
+                page=page_number,
+                chunk_index=chunk_index,
+                section_title=_guess_section_title(chunk),
+                structure=_detect_structure_label(chunk),
             )
             chunk_index += 1
-    return chunks
 
 
 def _embed_texts(
     embedder: OpenAIEmbeddings | Callable[[Sequence[str]], list[list[float]]],
     texts: Sequence[str],
+    *,
+    batch_size: int | None = None,
+    max_concurrency: int | None = None,
 ) -> list[list[float]]:
-    if hasattr(embedder, "embed_documents"):
-        return embedder.embed_documents(list(texts))
-    return embedder(list(texts))
+    """Embed texts in size-tuned sub-batches dispatched concurrently.
+
+    One giant request serializes the whole document set behind a single
+    round-trip; splitting into batches and overlapping them amortizes the
+    per-request setup cost across the corpus. Results come back in input
+    order.
+    """
+    if batch_size is None:
+        batch_size = int(os.getenv("POLICY_EMBED_BATCH", "128"))
+    if max_concurrency is None:
+        max_concurrency = int(os.getenv("POLICY_EMBED_CONCURRENCY", "8"))
+
+    items = list(texts)
+    if not hasattr(embedder, "embed_documents"):
+        return embedder(items)
+    if len(items) <= batch_size:
+        return embedder.embed_documents(items)
+
+    batches = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+    if hasattr(embedder, "aembed_documents"):
+
+        async def _run() -> list[list[list[float]]]:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _one(batch: list[str]) -> list[list[float]]:
+                async with semaphore:
+                    return await embedder.aembed_documents(batch)
+
+            return list(await asyncio.gather(*(_one(batch) for batch in batches)))
+
+        results = asyncio.run(_run())
+    else:
+        with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+            results = list(pool.map(embedder.embed_documents, batches))
+
+    return [vector for sub in results for vector in sub]
 
 
 def ingest_texts(
@@ -111,36 +206,58 @@ def ingest_texts(
     collection_name: str = DEFAULT_COLLECTION,
     client: object | None = None,
     embedder: OpenAIEmbeddings | Callable[[Sequence[str]], list[list[float]]] | None = None,
+    bulk: bool = False,
 ) -> int:
     if not texts:
         return 0
-    close_client = False
     if client is None:
+        # Shared handle owned by weaviate_client; do not close it here.
         client = get_client()
-        close_client = True
     if embedder is None:
         embedder = OpenAIEmbeddings(model="text-embedding-3-small")
-    try:
-        vectors = _embed_texts(embedder, texts)
-        ensure_policy_collection(client, name=collection_name, vector_dim=len(vectors[0]))
-        collection = client.collections.get(collection_name)
-
-        objects = [
-            DataObject(
-                properties={
-                    "text": text,
-                    **meta,
-                },
-                vector=vector,
-            )
-            for text, meta, vector in zip(texts, metadata, vectors, strict=True)
-        ]
-
-        collection.data.insert_many(objects=objects)
-        return len(objects)
-    finally:
-        if close_client:
-            client.close()
+    # Pipeline embed and insert: both are network-bound (OpenAI and
+    # Weaviate respectively), so the next window embeds while the
+    # previous one inserts on a single worker thread. Windows are
+    # bounded (POLICY_INSERT_BATCH, default 100) so peak memory stays
+    # constant in corpus size and each request stays under server-side
+    # limits.
+    insert_batch = int(os.getenv("POLICY_INSERT_BATCH", "100"))
+    collection = None
+    pending = None
+    total = 0
+    with ThreadPoolExecutor(max_workers=1) as inserter:
+        for start in range(0, len(texts), insert_batch):
+            window_texts = list(texts[start : start + insert_batch])
+            window_meta = metadata[start : start + insert_batch]
+            vectors = _embed_texts(embedder, window_texts)
+            if collection is None:
+                ensure_policy_collection(
+                    client, name=collection_name, vector_dim=len(vectors[0])
+                )
+                collection = client.collections.get(collection_name)
+                if bulk:
+                    # Fresh bulk imports have no concurrent readers that
+                    # need quorum acks; ONE skips the extra replica waits
+                    # on every insert_many call.
+                    collection = collection.with_consistency_level(ConsistencyLevel.ONE)
+            window = [
+                DataObject(
+                    properties={
+                        "text": text,
+                        **meta,
+                    },
+                    vector=vector,
+                )
+                for text, meta, vector in zip(window_texts, window_meta, vectors, strict=True)
+            ]
+            if pending is not None:
+                # One window in flight at most: back-pressure caps memory.
+                pending.result()
+            pending = inserter.submit(collection.data.insert_many, window)
+            total += len(window)
+        if pending is not None:
+            pending.result()
+    return total
 
 
 def ingest_policy_pdf(
@@ -150,23 +267,44 @@ def ingest_policy_pdf(
     client: object | None = None,
     embedder: OpenAIEmbeddings | Callable[[Sequence[str]], list[list[float]]] | None = None,
 ) -> int:
-    pages = load_pdf_pages(path)
-    chunks = build_chunks(pages, source=str(path))
-    texts = [chunk.text for chunk in chunks]
-    metadata = [
-        {
-            "source": chunk.source,
-            "page": chunk.page,
-            "chunk_index": chunk.chunk_index,
-            "section_title": chunk.section_title or "",
-            "structure": chunk.structure,
-        }
-        for chunk in chunks
-    ]
-    return ingest_texts(
-        texts,
-        metadata,
-        collection_name=collection_name,
-        client=client,
-        embedder=embedder,
-    )
+    # Stream pages -> chunks -> bounded buffers so the whole manual never
+    # sits in memory at once; each full buffer flows through the pipelined
+    # ingest_texts path below.
+    buffer_size = int(os.getenv("POLICY_INGEST_BUFFER", "500"))
+    if client is None:
+        client = get_client()
+    if embedder is None:
+        embedder = OpenAIEmbeddings(model="text-embedding-3-small")
+    texts: list[str] = []
+    metadata: list[dict[str, object]] = []
+    total = 0
+
+    def _flush() -> int:
+        count = ingest_texts(
+            texts,
+            metadata,
+            collection_name=collection_name,
+            client=client,
+            embedder=embedder,
+            bulk=True,
+        )
+        texts.clear()
+        metadata.clear()
+        return count
+
+    for chunk in build_chunks(iter_pdf_pages(path), source=str(path)):
+        texts.append(chunk.text)
+        metadata.append(
+            {
+                "source": chunk.source,
+                "page": chunk.page,
+                "chunk_index": chunk.chunk_index,
+                "section_title": chunk.section_title or "",
+                "structure": chunk.structure,
+            }
+        )
+        if len(texts) >= buffer_size:
+            total += _flush()
+    if texts:
+        total += _flush()
+    return total
@@ -1,30 +1,57 @@
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
+import re
 from dataclasses import dataclass
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from queue import SimpleQueue
 from typing import Sequence
 
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - orjson optional
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r"\s+")
 
-def _ensure_file_logging() -> None:
-    if not logger.handlers:
-        logs_dir = Path(__file__).resolve().parents[3] / "logs"
-        logs_dir.mkdir(parents=True, exist_ok=True)
-        handler = logging.FileHandler(logs_dir / "policy_rerank.log")
-        formatter = logging.Formatter(
+
+@lru_cache(maxsize=1)
+def _start_rerank_log_listener() -> QueueListener:
+    # Rerank logging goes through a queue so logger calls on the retrieval
+    # path only enqueue a record; formatting and file I/O happen on the
+    # listener thread (same pattern as the orchestrator's logger).
+    logs_dir = Path(__file__).resolve().parents[3] / "logs"
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    handler = logging.FileHandler(logs_dir / "policy_rerank.log")
+    handler.setFormatter(
+        logging.Formatter(
             fmt="%(asctime)s %(levelname)s %(name)s %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger.setLevel(logging.DEBUG)
+    )
+    queue: SimpleQueue = SimpleQueue()
+    logger.addHandler(QueueHandler(queue))
+    logger.setLevel(logging.DEBUG)
+    listener = QueueListener(queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+def _ensure_file_logging() -> None:
+    _start_rerank_log_listener()
+
+from weaviate.classes.query import MetadataQuery
 
 from altitude_warning.policy.weaviate_client import DEFAULT_COLLECTION, get_client
 
@@ -49,9 +76,42 @@ _ALTITUDE_TERMS = (
 )
 
 
+@lru_cache(maxsize=8)
+def _terms_pattern(terms: tuple[str, ...]) -> re.Pattern[str]:
+    # Lookahead alternation so overlapping terms ("altitude" inside
+    # "maximum altitude") are each still counted, matching the old
+    # per-term substring checks in a single scan.
+    return re.compile("(?=(" + "|".join(map(re.escape, terms)) + "))")
+
+
 def _keyword_boost(text: str, terms: Sequence[str]) -> int:
-    lowered = text.lower()
-    return sum(1 for term in terms if term in lowered)
+    return len(set(_terms_pattern(tuple(terms)).findall(text.lower())))
+
+
+_DEFAULT_EMBED_MODEL = "text-embedding-3-small"
+
+
+@lru_cache(maxsize=1024)
+def _embed_query_cached(model_name: str, query: str) -> tuple[float, ...]:
+    """Memoize query embeddings: each distinct query costs one API round-trip.
+
+    The orchestrator derives queries from quantized telemetry, so repeats are
+    common; a hit returns in microseconds instead of an embedding call. The
+    tuple is hashable and compact enough to keep 1024 entries resident.
+    """
+    embedder = OpenAIEmbeddings(model=model_name)
+    return tuple(embedder.embed_query(query))
+
+
+def embed_policy_query(query: str, *, model_name: str = _DEFAULT_EMBED_MODEL) -> list[float]:
+    """Embed a policy query through the process-wide lru cache.
+
+    Public entry point for callers outside this module (e.g. the semantic
+    cache) so they share the cache without touching its internals. The query
+    is whitespace-normalized to the same key form used below, so a cache
+    probe and a following retrieval miss reuse one embedding round-trip.
+    """
+    return list(_embed_query_cached(model_name, " ".join(query.split())))
 
 
 def retrieve_policy_context(
@@ -60,58 +120,137 @@ def retrieve_policy_context(
     top_k: int = 3,
     collection_name: str = DEFAULT_COLLECTION,
     embedder: OpenAIEmbeddings | None = None,
+    llm_rerank: bool | None = None,
+    rerank_model: str | None = None,
 ) -> list[PolicySnippet]:
     if not query.strip():
         return []
 
+    # get_client() hands back a shared connection; closing it here would
+    # force the next query to pay the handshake again.
     client = get_client()
-    try:
-        if not client.collections.exists(collection_name):
-            return []
-
-        if embedder is None:
-            embedder = OpenAIEmbeddings(model="text-embedding-3-small")
+    if not client.collections.exists(collection_name):
+        return []
 
+    if embedder is None:
+        vector = embed_policy_query(query)
+    else:
         vector = embedder.embed_query(query)
-        collection = client.collections.get(collection_name)
-        candidate_k = max(top_k * 3, top_k)
-        result = collection.query.near_vector(
-            near_vector=vector,
-            limit=candidate_k,
-            return_properties=["text", "source", "page", "chunk_index", "section_title", "structure"],
-            return_metadata=["distance"],
+    collection = client.collections.get(collection_name)
+    if llm_rerank is None:
+        llm_rerank = _should_llm_rerank()
+    return _search_with_vector(
+        collection, query, vector, top_k=top_k, llm_rerank=llm_rerank, rerank_model=rerank_model
+    )
+
+
+def retrieve_policy_context_many(
+    queries: Sequence[str],
+    *,
+    top_k: int = 3,
+    collection_name: str = DEFAULT_COLLECTION,
+    embedder: OpenAIEmbeddings | None = None,
+    llm_rerank: bool | None = None,
+    rerank_model: str | None = None,
+) -> list[list[PolicySnippet]]:
+    """Batch variant of `retrieve_policy_context` for scenario sweeps.
+
+    All queries are embedded in one embeddings request (the endpoint accepts
+    a list input), so N queries cost one HTTP round-trip instead of N; the
+    vector search itself stays per query. Results align with the input order,
+    with empty-query positions returning [].
+    """
+    if not queries:
+        return []
+
+    client = get_client()
+    if not client.collections.exists(collection_name):
+        return [[] for _ in queries]
+
+    cleaned = [" ".join(query.split()) for query in queries]
+    to_embed = [query for query in cleaned if query]
+    if not to_embed:
+        return [[] for _ in queries]
+    if embedder is None:
+        embedder = OpenAIEmbeddings(model=_DEFAULT_EMBED_MODEL)
+    vectors = iter(embedder.embed_documents(to_embed))
+
+    collection = client.collections.get(collection_name)
+    if llm_rerank is None:
+        llm_rerank = _should_llm_rerank()
+    return [
+        _search_with_vector(
+            collection,
+            query,
+            next(vectors),
+            top_k=top_k,
+            llm_rerank=llm_rerank,
+            rerank_model=rerank_model,
         )
+        if query
+        else []
+        for query in cleaned
+    ]
 
-        snippets: list[PolicySnippet] = []
-        for obj in result.objects:
-            props = obj.properties or {}
-            snippets.append(
-                PolicySnippet(
-                    text=str(props.get("text", "")),
-                    source=str(props.get("source", "")),
-                    page=int(props.get("page", 0) or 0),
-                    score=getattr(obj.metadata, "distance", None),
-                    section_title=str(props.get("section_title") or "") or None,
-                    structure=str(props.get("structure") or "body") or "body",
-                )
-            )
-        snippets.sort(
-            key=lambda item: (
-                -_keyword_boost(item.text, _ALTITUDE_TERMS),
-                0 if item.structure == "body" else 1,
-                item.score if item.score is not None else 1.0,
+
+def _search_with_vector(
+    collection: object,
+    query: str,
+    vector: Sequence[float],
+    *,
+    top_k: int,
+    llm_rerank: bool,
+    rerank_model: str | None,
+) -> list[PolicySnippet]:
+    # Fetch only what downstream will consume: the reranker looks at
+    # max(top_k*2, 6) candidates; without it, the keyword-boost sort just
+    # needs modest headroom above top_k to be able to promote snippets.
+    candidate_k = max(top_k * 2, 6) if llm_rerank else top_k * 2
+    # Fetch only what downstream code reads: structure feeds the sort key,
+    # section_title is only needed for the rerank prompt, and chunk_index
+    # was never consumed. Fewer properties means fewer bytes per object
+    # over gRPC.
+    return_properties = ["text", "source", "page", "structure"]
+    if llm_rerank:
+        return_properties.append("section_title")
+    result = collection.query.near_vector(
+        near_vector=vector,
+        limit=candidate_k,
+        return_properties=return_properties,
+        return_metadata=MetadataQuery(distance=True),
+    )
+
+    snippets: list[PolicySnippet] = []
+    for obj in result.objects:
+        props = obj.properties or {}
+        snippets.append(
+            PolicySnippet(
+                text=str(props.get("text", "")),
+                source=str(props.get("source", "")),
+                page=int(props.get("page", 0) or 0),
+                score=getattr(obj.metadata, "distance", None),
+                section_title=str(props.get("section_title") or "") or None,
+                structure=str(props.get("structure") or "body") or "body",
             )
         )
-        if _should_llm_rerank() and snippets:
-            _ensure_file_logging()
-            candidate_count = min(len(snippets), max(top_k * 2, 6))
-            reranked = _llm_rerank_snippets(query, snippets[:candidate_count])
-            # keep remaining snippets after reranked list to preserve coverage
-            remainder = [s for s in snippets if s not in reranked]
-            snippets = reranked + remainder
-        return snippets[:top_k]
-    finally:
-        client.close()
+    snippets.sort(
+        key=lambda item: (
+            -_keyword_boost(item.text, _ALTITUDE_TERMS),
+            0 if item.structure == "body" else 1,
+            item.score if item.score is not None else 1.0,
+        )
+    )
+    if llm_rerank and snippets:
+        _ensure_file_logging()
+        candidate_count = min(len(snippets), max(top_k * 2, 6))
+        reranked = _llm_rerank_snippets(query, snippets[:candidate_count], model_name=rerank_model)
+        # keep remaining snippets after reranked list to preserve coverage;
+        # both lists hold the same objects, so identity is enough and avoids
+        # quadratic field-by-field dataclass comparisons
+        reranked_ids = {id(s) for s in reranked}
+        remainder = [s for s in snippets if id(s) not in reranked_ids]
+        snippets = reranked + remainder
+    return snippets[:top_k]
 
 
 def _should_llm_rerank() -> bool:
@@ -133,9 +272,32 @@ def _extract_json_payload(content: str) -> str:
     return cleaned.strip()
 
 
-def _llm_rerank_snippets(query: str, snippets: Sequence[PolicySnippet]) -> list[PolicySnippet]:
-    model_name = os.getenv("POLICY_RERANK_MODEL", "gpt-4o-mini")
-    llm = ChatOpenAI(model=model_name, temperature=0)
+# Module-level so the instruction block is one shared constant and the
+# prompt prefix stays byte-identical across calls (provider prompt caches
+# key on exact prefixes).
+_RERANK_INSTRUCTIONS = (
+    "You are ranking FAA Part 107 policy snippets for how well they answer the pilot's query.\n"
+    "Given the query and snippets, assign each snippet a relevance score from 0 to 3.\n"
+    "3 = directly states the applicable regulation or numeric limit;\n"
+    "2 = strongly implies relevant guidance;\n"
+    "1 = tangential mention; 0 = irrelevant.\n"
+    "Respond with EXACT JSON ONLY (no prose): {\"scores\": [{\"id\": <snippet_id>, \"score\": <0-3>, \"reason\": \"short note\"}]}."
+)
+
+
+@lru_cache(maxsize=4)
+def _rerank_llm(model_name: str) -> ChatOpenAI:
+    # One client per model; re-instantiating ChatOpenAI per call rebuilds
+    # its HTTP connection pool.
+    return ChatOpenAI(model=model_name, temperature=0)
+
+
+def _llm_rerank_snippets(
+    query: str, snippets: Sequence[PolicySnippet], model_name: str | None = None
+) -> list[PolicySnippet]:
+    if model_name is None:
+        model_name = os.getenv("POLICY_RERANK_MODEL", "gpt-4o-mini")
+    llm = _rerank_llm(model_name)
     logger.info(
         "policy_rerank.start",
         extra={
@@ -146,7 +308,7 @@ def _llm_rerank_snippets(query: str, snippets: Sequence[PolicySnippet]) -> list[
     )
     snippet_payload = []
     for idx, snippet in enumerate(snippets, start=1):
-        text_preview = " ".join(snippet.text.split())[:800]
+        text_preview = _WS_RE.sub(" ", snippet.text)[:800]
         snippet_payload.append(
             {
                 "id": idx,
@@ -156,31 +318,18 @@ def _llm_rerank_snippets(query: str, snippets: Sequence[PolicySnippet]) -> list[
             }
         )
 
-    instructions = (
-        "You are ranking FAA Part 107 policy snippets for how well they answer the pilot's query.\n"
-        "Given the query and snippets, assign each snippet a relevance score from 0 to 3.\n"
-        "3 = directly states the applicable regulation or numeric limit;\n"
-        "2 = strongly implies relevant guidance;\n"
-        "1 = tangential mention; 0 = irrelevant.\n"
-        "Respond with EXACT JSON ONLY (no prose): {\"scores\": [{\"id\": <snippet_id>, \"score\": <0-3>, \"reason\": \"short note\"}]}."
-    )
-
-    prompt = (
-        f"Query: {query}\n"
-        f"Snippets:\n" +
-        "\n".join(
-            f"Snippet {item['id']} [structure={item['structure']} section={item['section']}]: {item['text']}"
-            for item in snippet_payload
-        )
-    )
-    message = f"{instructions}\n\n{prompt}"
+    if orjson is not None:
+        payload_json = orjson.dumps(snippet_payload).decode()
+    else:
+        payload_json = json.dumps(snippet_payload)
+    message = f"{_RERANK_INSTRUCTIONS}\n\nQuery: {query}\nSnippets (JSON array): {payload_json}"
 
     try:
         response = llm.invoke(message)
         content = response.content if hasattr(response, "content") else str(response)
         logger.debug("policy_rerank.raw content=%s", content)
         payload = _extract_json_payload(content)
-        data = json.loads(payload)
+        data = orjson.loads(payload) if orjson is not None else json.loads(payload)
         scores = {int(entry["id"]): float(entry["score"]) for entry in data.get("scores", [])}
     except Exception:
         logger.exception("policy_rerank.failed")
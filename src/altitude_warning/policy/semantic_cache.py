@@ -0,0 +1,106 @@
+"""Weaviate-backed semantic cache sitting in front of policy retrieval.
+
+Sweeps issue near-duplicate queries (shared altitude/ceiling vocabulary);
+a hit against a stored query vector returns the cached snippets and skips
+both the fresh vector search and, unlike the in-process lru caches, it
+survives process restarts.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+
+from weaviate.classes.config import Configure, DataType, Property
+from weaviate.classes.query import MetadataQuery
+
+from altitude_warning.policy.retriever import (
+    PolicySnippet,
+    embed_policy_query,
+    retrieve_policy_context,
+)
+from altitude_warning.policy.weaviate_client import DEFAULT_COLLECTION, get_client
+
+
+CACHE_COLLECTION = "PolicyQueryCache"
+
+# Cosine-distance ceiling for treating a stored query as a duplicate;
+# 0.05 keeps only rephrasings of the same telemetry situation.
+DEFAULT_MAX_DISTANCE = 0.05
+
+
+def _ensure_cache_collection(client: object, cache_collection: str) -> None:
+    if client.collections.exists(cache_collection):
+        return
+    client.collections.create(
+        name=cache_collection,
+        vectorizer_config=Configure.Vectorizer.none(),
+        properties=[
+            Property(name="query", data_type=DataType.TEXT),
+            # Opaque payload, never filtered or searched.
+            Property(
+                name="snippets_json",
+                data_type=DataType.TEXT,
+                index_filterable=False,
+                index_searchable=False,
+            ),
+        ],
+    )
+
+
+def cached_retrieve(
+    query: str,
+    *,
+    top_k: int = 3,
+    max_distance: float = DEFAULT_MAX_DISTANCE,
+    collection_name: str = DEFAULT_COLLECTION,
+    cache_collection: str = CACHE_COLLECTION,
+    embedder: object | None = None,
+) -> list[PolicySnippet]:
+    """Retrieve policy snippets, reusing results of near-duplicate past queries.
+
+    The query is embedded once (through `embed_policy_query`'s lru cache, so
+    a following miss re-uses the same vector), probed against the
+    PolicyQueryCache collection, and answered from the stored snippets when a
+    neighbor sits within `max_distance`. On a miss the real
+    `retrieve_policy_context` runs and its result is stored for next time.
+    """
+    if not query.strip():
+        return []
+
+    if embedder is None:
+        vector = embed_policy_query(query)
+    else:
+        vector = embedder.embed_query(query)
+    client = get_client()
+    _ensure_cache_collection(client, cache_collection)
+    cache = client.collections.get(cache_collection)
+
+    result = cache.query.near_vector(
+        near_vector=vector,
+        limit=1,
+        return_properties=["snippets_json"],
+        return_metadata=MetadataQuery(distance=True),
+    )
+    if result.objects:
+        hit = result.objects[0]
+        distance = getattr(hit.metadata, "distance", None)
+        if distance is not None and distance < max_distance:
+            stored = json.loads(str((hit.properties or {}).get("snippets_json", "[]")))
+            return [PolicySnippet(**entry) for entry in stored[:top_k]]
+
+    snippets = retrieve_policy_context(
+        query, top_k=top_k, collection_name=collection_name, embedder=embedder
+    )
+    if snippets:
+        # An empty result usually means PolicyChunks is not ingested yet or
+        # retrieval failed transiently; caching it would pin [] for every
+        # near-duplicate query even after ingestion succeeds.
+        cache.data.insert(
+            properties={
+                "query": query,
+                "snippets_json": json.dumps([asdict(snippet) for snippet in snippets]),
+            },
+            vector=vector,
+        )
+    return snippets
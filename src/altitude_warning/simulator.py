@@ -2,8 +2,14 @@ from __future__ import annotations
 
 import json
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
 from altitude_warning.models import TelemetryEvent
 
 
@@ -11,21 +17,33 @@ def default_scenario_path() -> Path:
     return Path(__file__).resolve().parents[2] / "data" / "scenarios" / "feature1_altitude_breach.json"
 
 
-def load_scenario_events(path: Path) -> list[TelemetryEvent]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    events = []
-    for event in payload.get("events", []):
-        events.append(
-            TelemetryEvent(
-                drone_id=event["drone_id"],
-                lat=event["lat"],
-                lon=event["lon"],
-                altitude_ft=event["altitude_ft"],
-                vertical_speed_fps=event["vertical_speed_fps"],
-                timestamp_iso=event["timestamp_iso"],
-            )
+def events_from_payload(payload: dict) -> list[TelemetryEvent]:
+    """Build telemetry events from an already-parsed scenario payload."""
+    return [
+        TelemetryEvent(
+            drone_id=event["drone_id"],
+            lat=event["lat"],
+            lon=event["lon"],
+            altitude_ft=event["altitude_ft"],
+            vertical_speed_fps=event["vertical_speed_fps"],
+            timestamp_iso=event["timestamp_iso"],
         )
-    return events
+        for event in payload.get("events", [])
+    ]
+
+
+@lru_cache(maxsize=8)
+def _load_scenario_events_cached(path_str: str, mtime_ns: int) -> tuple[TelemetryEvent, ...]:
+    # mtime_ns in the key busts the cache when the scenario file changes.
+    raw = Path(path_str).read_bytes()
+    payload = orjson.loads(raw) if orjson is not None else json.loads(raw.decode("utf-8"))
+    return tuple(events_from_payload(payload))
+
+
+def load_scenario_events(path: Path) -> list[TelemetryEvent]:
+    # Fresh list per call so callers can reorder/extend without touching
+    # the cached copy; the events themselves are shared.
+    return list(_load_scenario_events_cached(str(path), path.stat().st_mtime_ns))
 
 
 def generate_altitude_breach_events() -> list[TelemetryEvent]:
@@ -1,6 +1,7 @@
+import numpy as np
 from langchain_core.tools import tool
 
-from altitude_warning.config import THRESHOLDS
+from altitude_warning.config import CONFIDENCE_AUTO_NOTIFY, HORIZON_SECONDS, RISK_ALERT_THRESHOLD
 
 
 def ceiling_tool(lat: float, lon: float) -> float:
@@ -12,7 +13,7 @@ def ceiling_tool(lat: float, lon: float) -> float:
 
 
 def trajectory_tool(current_altitude_ft: float, vertical_speed_fps: float, horizon_seconds: int | None = None) -> float:
-    horizon = horizon_seconds if horizon_seconds is not None else THRESHOLDS.horizon_seconds
+    horizon = horizon_seconds if horizon_seconds is not None else HORIZON_SECONDS
     return current_altitude_ft + (vertical_speed_fps * horizon)
 
 
@@ -22,20 +23,54 @@ def risk_tool(predicted_altitude_ft: float, ceiling_ft: float, vertical_speed_fp
         return 1.0, 0.3
 
     margin_ratio = (predicted_altitude_ft - ceiling_ft) / ceiling_ft
-    climb_factor = max(vertical_speed_fps, 0.0) / 10.0
+    climb_factor = vertical_speed_fps / 10.0 if vertical_speed_fps > 0.0 else 0.0
 
     # Phase A intent: if projected altitude exceeds ceiling, force an early-warning level score.
+    # Explicit branches instead of nested min()/max() calls keep this pure
+    # scalar path cheap; it runs once per telemetry event.
     if predicted_altitude_ft > ceiling_ft:
-        risk_score = max(0.0, min(1.0, 0.82 + min(0.15, margin_ratio * 2.0) + 0.05 * climb_factor))
+        bump = margin_ratio * 2.0
+        if bump > 0.15:
+            bump = 0.15
+        risk_score = 0.82 + bump + 0.05 * climb_factor
     else:
-        risk_score = max(0.0, min(1.0, 0.55 + margin_ratio + 0.2 * climb_factor))
-    confidence = max(0.0, min(1.0, 0.6 + 0.25 * climb_factor))
+        risk_score = 0.55 + margin_ratio + 0.2 * climb_factor
+    if risk_score > 1.0:
+        risk_score = 1.0
+    elif risk_score < 0.0:
+        risk_score = 0.0
+    confidence = 0.6 + 0.25 * climb_factor
+    if confidence > 1.0:
+        confidence = 1.0
     return risk_score, confidence
 
 
+def risk_tool_batch(
+    predicted_altitude_ft: "np.ndarray",
+    ceiling_ft: "np.ndarray",
+    vertical_speed_fps: "np.ndarray",
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """Vectorized risk_tool over aligned arrays: returns (risk_scores, confidences)."""
+    pred = np.asarray(predicted_altitude_ft, dtype=np.float64)
+    ceiling = np.asarray(ceiling_ft, dtype=np.float64)
+    vspeed = np.asarray(vertical_speed_fps, dtype=np.float64)
+
+    safe_ceiling = np.where(ceiling > 0.0, ceiling, 1.0)
+    margin_ratio = (pred - safe_ceiling) / safe_ceiling
+    climb_factor = np.maximum(vspeed, 0.0) / 10.0
+
+    breach = 0.82 + np.minimum(0.15, margin_ratio * 2.0) + 0.05 * climb_factor
+    below = 0.55 + margin_ratio + 0.2 * climb_factor
+    risk_score = np.clip(np.where(pred > ceiling, breach, below), 0.0, 1.0)
+    confidence = np.clip(0.6 + 0.25 * climb_factor, 0.0, 1.0)
+
+    invalid = ceiling <= 0.0
+    return np.where(invalid, 1.0, risk_score), np.where(invalid, 0.3, confidence)
+
+
 def policy_tool(risk_score: float, confidence: float) -> tuple[str, bool]:
-    if risk_score >= THRESHOLDS.risk_alert_threshold:
-        if confidence >= THRESHOLDS.confidence_auto_notify:
+    if risk_score >= RISK_ALERT_THRESHOLD:
+        if confidence >= CONFIDENCE_AUTO_NOTIFY:
             return "auto_notify", True
         return "hitl_review", True
     return "monitor", False
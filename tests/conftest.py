@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import socket
+from datetime import UTC, datetime
+
+import pytest
+
+from altitude_warning.policy.weaviate_client import get_client
+
+
+@pytest.fixture(scope="session")
+def run_stamp() -> str:
+    """One timestamp per test session for output-file naming.
+
+    Tests that write baseline CSVs share this stamp, so a session produces
+    one file per baseline kind instead of one per test invocation.
+    """
+    return datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+
+
+@pytest.fixture(autouse=True)
+def no_network(request, monkeypatch):
+    """Fail fast if a pure-unit test tries to open an outbound connection.
+
+    Unit tests run entirely in-process (FakeListLLM, fake embedders); an
+    accidental real call would add seconds of connect/timeout latency and
+    flake on machines without credentials. Outbound lookups are blocked
+    unless the test is marked `integration` or uses the shared Weaviate
+    client. Only resolution/connect entry points are patched — raw
+    socket.socket stays intact because asyncio's event loop needs
+    socketpair internally.
+    """
+    if "integration" in request.node.keywords or "weaviate_client" in request.fixturenames:
+        return
+
+    def _blocked(*args, **kwargs):
+        raise RuntimeError("network disabled for unit tests; mark the test with 'integration'")
+
+    monkeypatch.setattr(socket, "create_connection", _blocked)
+    monkeypatch.setattr(socket, "getaddrinfo", _blocked)
+
+
+@pytest.fixture(scope="session")
+def weaviate_client():
+    """One shared Weaviate client for the whole test session.
+
+    Each test previously built (and closed) its own client, paying a gRPC
+    handshake plus readiness probe per test. The session fixture connects
+    once and skips every dependent test when Weaviate is not running.
+    """
+    try:
+        client = get_client()
+    except Exception as exc:  # pragma: no cover - depends on local setup
+        pytest.skip(f"Weaviate client unavailable: {exc}")
+    if not client.is_ready():
+        pytest.skip("Weaviate is not running on localhost.")
+    yield client
+    client.close()
@@ -5,6 +5,9 @@ from dotenv import load_dotenv
 from langsmith.client import Client
 
 
+pytestmark = pytest.mark.integration
+
+
 def test_langsmith_api_key_auth() -> None:
     load_dotenv()
     key = os.getenv("LANGCHAIN_API_KEY")
@@ -5,6 +5,9 @@ from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
 
 
+pytestmark = pytest.mark.integration
+
+
 def test_openai_api_key_auth() -> None:
     load_dotenv()
     key = os.getenv("OPENAI_API_KEY")
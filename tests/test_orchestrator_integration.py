@@ -3,7 +3,6 @@ from __future__ import annotations
 import csv
 import os
 from pathlib import Path
-from datetime import UTC, datetime
 
 import pytest
 
@@ -19,7 +18,7 @@ def _skip_if_no_key() -> None:
         pytest.skip("OPENAI_API_KEY not set")
 
 
-def test_orchestrator_with_real_model() -> None:
+def test_orchestrator_with_real_model(run_stamp: str) -> None:
     _skip_if_no_key()
     scenario_path = default_scenario_path()
     if not scenario_path.exists():
@@ -53,8 +52,7 @@ def test_orchestrator_with_real_model() -> None:
 
     output_dir = Path("outputs")
     output_dir.mkdir(parents=True, exist_ok=True)
-    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
-    csv_path = output_dir / f"baseline_llm_runs_with_weaviate_{stamp}.csv"
+    csv_path = output_dir / f"baseline_llm_runs_with_weaviate_{run_stamp}.csv"
     with csv_path.open("w", newline="", encoding="utf-8") as fh:
         writer = csv.DictWriter(fh, fieldnames=[*request_payload.keys(), *response_payload.keys()])
         writer.writeheader()
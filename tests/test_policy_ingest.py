@@ -2,56 +2,66 @@ from __future__ import annotations
 
 from uuid import uuid4
 
-import pytest
-
 from altitude_warning.policy.ingest import ingest_texts
-from altitude_warning.policy.weaviate_client import get_client
-
-
-def _client_or_skip():
-    try:
-        client = get_client()
-    except Exception as exc:  # pragma: no cover - depends on local setup
-        pytest.skip(f"Weaviate client unavailable: {exc}")
-    if not client.is_ready():
-        client.close()
-        pytest.skip("Weaviate is not running on localhost.")
-    return client
 
 
 def _fake_embedder(texts: list[str]) -> list[list[float]]:
     return [[float(idx + 1), 0.0, 0.5] for idx, _ in enumerate(texts)]
 
 
-def test_ingest_texts_into_weaviate() -> None:
-    client = _client_or_skip()
+def test_ingest_texts_into_weaviate(weaviate_client) -> None:
+    collection_name = f"PolicyChunksTest_{uuid4().hex[:8]}"
+    texts = ["Section 107.51 altitude limits.", "Section 107.23 operational limits."]
+    metadata = [
+        {
+            "source": "unit-test",
+            "page": 1,
+            "chunk_index": 0,
+            "section_title": "Section 107.51",
+            "structure": "body",
+        },
+        {
+            "source": "unit-test",
+            "page": 2,
+            "chunk_index": 1,
+            "section_title": "Section 107.23",
+            "structure": "body",
+        },
+    ]
+    count = ingest_texts(
+        texts,
+        metadata,
+        collection_name=collection_name,
+        client=weaviate_client,
+        embedder=_fake_embedder,
+    )
+    assert count == 2
+    assert weaviate_client.collections.exists(collection_name)
+
+
+def test_ingest_texts_batches_multiple_windows(weaviate_client) -> None:
+    # 250 rows spans three insert windows (POLICY_INSERT_BATCH defaults to
+    # 100), exercising the pipelined embed/insert overlap rather than the
+    # single-window fast path.
     collection_name = f"PolicyChunksTest_{uuid4().hex[:8]}"
-    try:
-        texts = ["Section 107.51 altitude limits.", "Section 107.23 operational limits."]
-        metadata = [
-            {
-                "source": "unit-test",
-                "page": 1,
-                "chunk_index": 0,
-                "section_title": "Section 107.51",
-                "structure": "body",
-            },
-            {
-                "source": "unit-test",
-                "page": 2,
-                "chunk_index": 1,
-                "section_title": "Section 107.23",
-                "structure": "body",
-            },
-        ]
-        count = ingest_texts(
-            texts,
-            metadata,
-            collection_name=collection_name,
-            client=client,
-            embedder=_fake_embedder,
-        )
-        assert count == 2
-        assert client.collections.exists(collection_name)
-    finally:
-        client.close()
+    texts = [f"Synthetic policy text {idx}." for idx in range(250)]
+    metadata = [
+        {
+            "source": "unit-test",
+            "page": idx + 1,
+            "chunk_index": idx,
+            "section_title": "",
+            "structure": "body",
+        }
+        for idx in range(250)
+    ]
+    count = ingest_texts(
+        texts,
+        metadata,
+        collection_name=collection_name,
+        client=weaviate_client,
+        embedder=_fake_embedder,
+        bulk=True,
+    )
+    assert count == 250
+    assert weaviate_client.collections.exists(collection_name)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+from altitude_warning.policy.ingest import ingest_texts
+from altitude_warning.policy.retriever import retrieve_policy_context_many
+
+
+class _FakeEmbedder:
+    """Maps each known text/query onto a fixed axis so nearest-neighbor
+    search is deterministic: each query lands on its matching chunk."""
+
+    _VECTORS = {
+        "Drones must yield right of way to manned aircraft.": [1.0, 0.0, 0.0],
+        "Night operations require anti-collision lighting.": [0.0, 1.0, 0.0],
+        "right of way rules": [0.9, 0.1, 0.0],
+        "night lighting requirements": [0.1, 0.9, 0.0],
+    }
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._VECTORS[text]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self._VECTORS[text] for text in texts]
+
+
+def test_retrieve_policy_context_many_aligns_with_input_order(weaviate_client) -> None:
+    collection_name = f"PolicyChunksTest_{uuid4().hex[:8]}"
+    embedder = _FakeEmbedder()
+    texts = [
+        "Drones must yield right of way to manned aircraft.",
+        "Night operations require anti-collision lighting.",
+    ]
+    metadata = [
+        {
+            "source": "unit-test",
+            "page": idx + 1,
+            "chunk_index": idx,
+            "section_title": "Section 107.37",
+            "structure": "body",
+        }
+        for idx in range(len(texts))
+    ]
+    assert ingest_texts(
+        texts,
+        metadata,
+        collection_name=collection_name,
+        client=weaviate_client,
+        embedder=embedder.embed_documents,
+    ) == 2
+
+    # One embed_documents round-trip for the batch; the blank query must keep
+    # its slot so results align with the input order.
+    results = retrieve_policy_context_many(
+        ["right of way rules", "", "night lighting requirements"],
+        top_k=1,
+        collection_name=collection_name,
+        embedder=embedder,
+        llm_rerank=False,
+    )
+
+    assert len(results) == 3
+    assert results[0][0].text == texts[0]
+    assert results[1] == []
+    assert results[2][0].text == texts[1]
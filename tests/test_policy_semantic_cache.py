@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+from altitude_warning.policy import semantic_cache
+from altitude_warning.policy.retriever import PolicySnippet
+
+
+class _FakeEmbedder:
+    """Deterministic per-query vectors; distinct queries are far apart."""
+
+    _VECTORS = {
+        "altitude ceiling rules": [1.0, 0.0, 0.5],
+        "night operations": [0.0, 1.0, 0.0],
+    }
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._VECTORS[text]
+
+
+def test_cached_retrieve_serves_repeat_query_from_cache(weaviate_client, monkeypatch) -> None:
+    cache_collection = f"PolicyQueryCacheTest_{uuid4().hex[:8]}"
+    snippet = PolicySnippet(
+        text="Section 107.51: maximum altitude 400 ft AGL.",
+        source="unit-test",
+        page=1,
+        score=0.1,
+    )
+    calls: list[str] = []
+
+    def _fake_retrieve(query: str, **_kwargs) -> list[PolicySnippet]:
+        calls.append(query)
+        return [snippet]
+
+    monkeypatch.setattr(semantic_cache, "retrieve_policy_context", _fake_retrieve)
+
+    first = semantic_cache.cached_retrieve(
+        "altitude ceiling rules",
+        cache_collection=cache_collection,
+        embedder=_FakeEmbedder(),
+    )
+    assert first == [snippet]
+    assert calls == ["altitude ceiling rules"]
+
+    # Identical query vector: answered from the cache, no second retrieval.
+    second = semantic_cache.cached_retrieve(
+        "altitude ceiling rules",
+        cache_collection=cache_collection,
+        embedder=_FakeEmbedder(),
+    )
+    assert second == [snippet]
+    assert calls == ["altitude ceiling rules"]
+
+
+def test_cached_retrieve_does_not_cache_empty_results(weaviate_client, monkeypatch) -> None:
+    cache_collection = f"PolicyQueryCacheTest_{uuid4().hex[:8]}"
+    calls: list[str] = []
+
+    def _fake_retrieve(query: str, **_kwargs) -> list[PolicySnippet]:
+        calls.append(query)
+        return []
+
+    monkeypatch.setattr(semantic_cache, "retrieve_policy_context", _fake_retrieve)
+
+    for _ in range(2):
+        result = semantic_cache.cached_retrieve(
+            "night operations",
+            cache_collection=cache_collection,
+            embedder=_FakeEmbedder(),
+        )
+        assert result == []
+
+    # An empty miss (e.g. PolicyChunks not ingested yet) must not be pinned:
+    # the second call retrieves again instead of hitting a cached [].
+    assert calls == ["night operations", "night operations"]
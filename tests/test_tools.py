@@ -1,4 +1,4 @@
-from altitude_warning.tools import policy_tool, risk_tool, trajectory_tool
+from altitude_warning.tools import policy_tool, risk_tool, risk_tool_batch, trajectory_tool
 
 
 def test_trajectory_projection_increases_with_vertical_speed() -> None:
@@ -16,3 +16,21 @@ def test_risk_tool_bounds_values() -> None:
     risk, confidence = risk_tool(predicted_altitude_ft=500, ceiling_ft=300, vertical_speed_fps=20)
     assert 0.0 <= risk <= 1.0
     assert 0.0 <= confidence <= 1.0
+
+
+def test_risk_tool_batch_matches_scalar() -> None:
+    cases = [
+        (500.0, 300.0, 20.0),
+        (280.0, 400.0, -2.0),
+        (410.0, 400.0, 0.0),
+        (100.0, 0.0, 5.0),
+    ]
+    risks, confidences = risk_tool_batch(
+        [pred for pred, _, _ in cases],
+        [ceiling for _, ceiling, _ in cases],
+        [vspeed for _, _, vspeed in cases],
+    )
+    for (pred, ceiling, vspeed), risk, confidence in zip(cases, risks, confidences):
+        expected_risk, expected_confidence = risk_tool(pred, ceiling, vspeed)
+        assert risk == expected_risk
+        assert confidence == expected_confidence
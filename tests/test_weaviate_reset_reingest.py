@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+import hashlib
 import os
 from pathlib import Path
 
 import pytest
+from weaviate.classes.config import Configure
 
 from altitude_warning.policy.ingest import ingest_policy_pdf
-from altitude_warning.policy.weaviate_client import DEFAULT_COLLECTION, get_client
+from altitude_warning.policy.weaviate_client import DEFAULT_COLLECTION
 
 
 pytestmark = pytest.mark.integration
 
+# Sentinel collection recording the sha256 of the last fully ingested PDF, so
+# repeat runs skip re-parsing and re-embedding an unchanged manual.
+_META_COLLECTION = "PolicyChunksMeta"
+
 
 def _load_dotenv_if_available() -> None:
     try:
@@ -22,22 +28,31 @@ def _load_dotenv_if_available() -> None:
         pass
 
 
-def _client_or_skip():
-    try:
-        client = get_client()
-    except Exception as exc:  # pragma: no cover - depends on local setup
-        pytest.skip(f"Weaviate client unavailable: {exc}")
-    if not client.is_ready():
-        client.close()
-        pytest.skip("Weaviate is not running on localhost.")
-    return client
-
-
 def _is_truthy(value: str | None) -> bool:
     return (value or "").strip().lower() in {"1", "true", "yes", "on"}
 
 
-def test_reset_and_recreate_policy_collection_with_ingest() -> None:
+def _stored_pdf_sha256(client) -> str | None:
+    if not client.collections.exists(_META_COLLECTION):
+        return None
+    meta = client.collections.get(_META_COLLECTION)
+    response = meta.query.fetch_objects(limit=1)
+    if not response.objects:
+        return None
+    return response.objects[0].properties.get("pdf_sha256")
+
+
+def _store_pdf_sha256(client, digest: str) -> None:
+    if client.collections.exists(_META_COLLECTION):
+        client.collections.delete(_META_COLLECTION)
+    client.collections.create(
+        _META_COLLECTION,
+        vectorizer_config=Configure.Vectorizer.none(),
+    )
+    client.collections.get(_META_COLLECTION).data.insert({"pdf_sha256": digest})
+
+
+def test_reset_and_recreate_policy_collection_with_ingest(weaviate_client) -> None:
     if not _is_truthy(os.getenv("ALLOW_WEAVIATE_RESET_TEST")):
         pytest.skip(
             "Set ALLOW_WEAVIATE_RESET_TEST=1 to run destructive reset/re-ingest test."
@@ -50,21 +65,30 @@ def test_reset_and_recreate_policy_collection_with_ingest() -> None:
     pdf_path = Path("docs/faa_guides/remote_pilot_study_guide.pdf")
     assert pdf_path.exists(), f"Missing policy PDF: {pdf_path}"
 
-    client = _client_or_skip()
-    try:
-        if client.collections.exists(DEFAULT_COLLECTION):
-            client.collections.delete(DEFAULT_COLLECTION)
-
-        ingested_count = ingest_policy_pdf(
-            pdf_path,
-            collection_name=DEFAULT_COLLECTION,
-            client=client,
-        )
-        assert ingested_count > 0, "No chunks were ingested after reset."
-
-        assert client.collections.exists(DEFAULT_COLLECTION)
-        collection = client.collections.get(DEFAULT_COLLECTION)
-        total_count = collection.aggregate.over_all(total_count=True).total_count or 0
-        assert total_count == ingested_count
-    finally:
-        client.close()
+    # Re-parsing plus re-embedding the full manual dominates this test's
+    # runtime; skip when the exact same PDF is already ingested unless the
+    # caller forces a rebuild with FORCE_REINGEST=1.
+    pdf_sha256 = hashlib.sha256(pdf_path.read_bytes()).hexdigest()
+    if (
+        not _is_truthy(os.getenv("FORCE_REINGEST"))
+        and weaviate_client.collections.exists(DEFAULT_COLLECTION)
+        and _stored_pdf_sha256(weaviate_client) == pdf_sha256
+    ):
+        pytest.skip("PDF already ingested (set FORCE_REINGEST=1 to rebuild).")
+
+    if weaviate_client.collections.exists(DEFAULT_COLLECTION):
+        weaviate_client.collections.delete(DEFAULT_COLLECTION)
+
+    ingested_count = ingest_policy_pdf(
+        pdf_path,
+        collection_name=DEFAULT_COLLECTION,
+        client=weaviate_client,
+    )
+    assert ingested_count > 0, "No chunks were ingested after reset."
+
+    assert weaviate_client.collections.exists(DEFAULT_COLLECTION)
+    collection = weaviate_client.collections.get(DEFAULT_COLLECTION)
+    total_count = collection.aggregate.over_all(total_count=True).total_count or 0
+    assert total_count == ingested_count
+
+    _store_pdf_sha256(weaviate_client, pdf_sha256)